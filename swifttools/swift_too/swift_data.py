@@ -1,11 +1,15 @@
+import functools
 import os
+import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fnmatch import fnmatch
 import boto3
 from botocore import UNSIGNED
 from botocore.client import Config
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .api_common import TOOAPI_Baseclass
 from .api_status import TOOStatus
@@ -22,6 +26,30 @@ except ImportError:
         return args[0]
 
 
+# Shared HTTP session, so file downloads reuse keep-alive connections rather
+# than doing a new TCP/TLS handshake per file. The connection pool is sized to
+# cover concurrent downloads from Swift_Data.download.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Size of chunks in which downloaded files are written to disk
+_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _s3_client():
+    """Anonymous S3 client for the HEASARC AWS mirror, created once and shared
+    by every Swift_Data query (boto3 clients are safe to use across threads)"""
+    config = Config(
+        connect_timeout=5,
+        retries={"max_attempts": 0},
+        signature_version=UNSIGNED,
+        max_pool_connections=16,
+    )
+    return boto3.client("s3", config=config)
+
+
 class Swift_DataFile(TOOAPI_Baseclass):
     """Class containing information about a swift data file that can be
     downloaded from the Swift Science Data Center
@@ -72,8 +100,8 @@ class Swift_DataFile(TOOAPI_Baseclass):
             self.outdir = outdir
         # Make the directories for the full path if they don't exist
         fulldir = os.path.join(self.outdir, self.path)
-        if not os.path.exists(fulldir):
-            os.makedirs(fulldir)
+        # Other files may be downloading into the same directory at once
+        os.makedirs(fulldir, exist_ok=True)
 
         # Download the data
         fullfilepath = os.path.join(self.outdir, self.path, self.filename)
@@ -83,14 +111,14 @@ class Swift_DataFile(TOOAPI_Baseclass):
             key_name = self.url.replace("https://heasarc.gsfc.nasa.gov/FTP/", "")
             self.s3.download_file("nasa-heasarc", key_name, fullfilepath)
         else:
-            r = requests.get(self.url, stream=True, allow_redirects=True)
-            if r.ok:
-                filedata = r.raw.read()
+            with _session.get(self.url, stream=True, allow_redirects=True) as r:
+                if not r.ok:
+                    return False
+                # Write the file out in chunks as it arrives, rather than
+                # holding the whole (possibly large) file in memory
                 with open(fullfilepath, "wb") as outfile:
-                    outfile.write(filedata)
-                self.localpath = fullfilepath
-            else:
-                return False
+                    shutil.copyfileobj(r.raw, outfile, _CHUNK_SIZE)
+            self.localpath = fullfilepath
 
         return True
 
@@ -129,6 +157,8 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
         Download the data straight away (default: True).
     quiet  : boolean
         When downloading, don't print anything out. (default: False)
+    threads : int
+        Number of files to download at once. (default: 8)
     entries : list
         List of files associated with data (')
     username : str
@@ -172,6 +202,7 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
         "match",
         "quiet",
         "aws",
+        "threads",
     ]
     _attributes = ["entries", "status"]
 
@@ -216,6 +247,8 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
             Download the data straight away (default: True).
         quiet : boolean
             When downloading, don't print anything out. (default: False)
+        threads : int
+            Number of files to download at once. (default: 8)
         match : str / list
             Only download files matching this filename pattern (e.g.
             "*xrt*pc*"). If multiple templates are given as a list, files
@@ -250,6 +283,8 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
         self.log = None
         # Should we display anything when downloading
         self.quiet = False
+        # Number of files to download at once
+        self.threads = 8
         # Download data straight away
         self.fetch = True
         # Only download files matching this expression
@@ -300,35 +335,25 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
 
     @all.setter
     def all(self, bool):
-        if self.all is not None:
-            self.xrt = self.bat = self.uvot = self.log = self.auxil = self.tdrss = bool
+        self.xrt = self.bat = self.uvot = self.log = self.auxil = self.tdrss = bool
 
     def _post_process(self):
         """A place to do things to API results after they have been fetched."""
         # Filter out files that don't match `match` expression
         if not self.uksdc and not self.itsdc and self.aws is True:
-            # Set up S3 stuff
-            config = Config(
-                connect_timeout=5,
-                retries={"max_attempts": 0},
-                signature_version=UNSIGNED,
-            )
-            s3 = boto3.client("s3", config=config)
+            s3 = _s3_client()
             for file in self.entries:
                 file.s3 = s3
         if self.match is not None:
             if type(self.match) is str:
                 self.match = [self.match]
-            i = 0
-            while i < len(self.entries):
-                keep = False
-                for match in self.match:
-                    if fnmatch(f"{self.entries[i].path}/{self.entries[i].filename}", match):
-                        keep = True
-                if not keep:
-                    del self.entries[i]
-                else:
-                    i += 1
+            # Build the filtered list in one pass rather than deleting from
+            # the middle of the list, and stop at the first matching pattern
+            self.entries = [
+                entry
+                for entry in self.entries
+                if any(fnmatch(f"{entry.path}/{entry.filename}", match) for match in self.match)
+            ]
 
     def validate(self):
         """Validate API submission before submit
@@ -376,28 +401,33 @@ class Swift_Data(TOOAPI_Baseclass, TOOAPI_ObsID):
         self.outdir = os.path.expandvars(self.outdir)
         self.outdir = os.path.abspath(self.outdir)
 
-        # Index any existing files
-        for i in range(len(self.entries)):
-            fullfilepath = os.path.join(self.outdir, self.entries[i].path, self.entries[i].filename)
-            if os.path.exists(fullfilepath):
-                self.entries[i].localpath = fullfilepath
-
-        # Download files to outdir
-        if self.quiet:
-            dfiles = self.entries
-        else:
-            dfiles = tqdm(self.entries, desc="Downloading files", unit="files")
-        for dfile in dfiles:
-            # Don't re-download a file unless clobber=True
-            localfile = f"{self.outdir}/{dfile.path}/{dfile.filename}"
-            if not self.clobber and os.path.exists(localfile) and not self.quiet:
-                warnings.warn(f"{dfile.filename} exists and not overwritten (set clobber=True to override this).")
-            elif not dfile.download(outdir=self.outdir):
-                self.status.error(f"Error downloading {dfile.filename}")
-                return False
-
-        # Everything worked we assume so return True
-        return True
+        # Index any existing files, and don't re-download them unless
+        # clobber=True
+        dfiles = list()
+        for dfile in self.entries:
+            fullfilepath = os.path.join(self.outdir, dfile.path, dfile.filename)
+            exists = os.path.exists(fullfilepath)
+            if exists:
+                dfile.localpath = fullfilepath
+            if exists and not self.clobber:
+                if not self.quiet:
+                    warnings.warn(f"{dfile.filename} exists and not overwritten (set clobber=True to override this).")
+            else:
+                dfiles.append(dfile)
+
+        # Download files to outdir, several at once
+        with ThreadPoolExecutor(max_workers=max(1, self.threads)) as executor:
+            futures = {executor.submit(dfile.download, outdir=self.outdir): dfile for dfile in dfiles}
+            done = as_completed(futures)
+            if not self.quiet:
+                done = tqdm(done, total=len(futures), desc="Downloading files", unit="files")
+            success = True
+            for future in done:
+                if not future.result():
+                    self.status.error(f"Error downloading {futures[future].filename}")
+                    success = False
+
+        return success
 
 
 # Shorthand Aliases for better PEP8 compliant and future compat
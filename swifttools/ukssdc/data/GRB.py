@@ -11,14 +11,142 @@ This documentation will be updated when I've written the code
 __docformat__ = "restructedtext en"
 
 
+import itertools
+import os
+import numpy as np
 import pandas as pd
 from .. import main as base
 from . import download as dl
 
+# Whether the back end supports resolving several GRB names, or getting
+# several spectra, in one call; set to False the first time it tells us
+# it doesn't, so we only try once.
+_batchNamesSupported = True
+_batchSpectraSupported = True
 
+# How the burst analyser data for each instrument are laid out: the
+# instruments we know about, those whose light curves are split by
+# binning method (and have BadBin flags), and the hardness ratio keys.
+_burstAnInstruments = ("BAT", "BAT_NoEvolution", "XRT", "UVOT")
+_burstAnBinnedInstruments = ("BAT", "BAT_NoEvolution")
+_burstAnHRKeys = {"BAT": ("HRData",), "XRT": ("HRData_WT", "HRData_PC")}
+
+
+# The targetIDs of GRB names that have already been resolved, so that
+# repeated lookups do not go back to the server. Names that were not
+# found are not kept, so that a GRB added to the catalogue later in the
+# session can still be resolved.
+_resolvedNames = {}
+
+
+def _resolveName(GRBName, verbose=False):
+    """Internal function to look up the targetID of a GRB name.
+
+    Successful lookups are cached, so repeated lookups of the same name
+    do not go back to the server.
+
+    Parameters
+    ----------
+
+    GRBName : str
+        The name of the GRB (e.g. "GRB 060729")
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    int or None
+        The integer targetID; if the GRB is not found, ``None``
+
+    """
+    if GRBName in _resolvedNames:
+        return _resolvedNames[GRBName]
+
+    sendData = {"name": GRBName}
+    tmp = base.submitAPICall("GRBNameToTargetID", sendData, verbose=verbose)
+    if tmp.status is base.APIStatus.NOTFOUND:
+        return None
+    if "targetID" in tmp:
+        _resolvedNames[GRBName] = tmp["targetID"]
+        return tmp["targetID"]
+    else:
+        raise RuntimeError("Unknown error; unexpected return; is your swifttools version up to date?")
+
+
+def _resolveNames(GRBNames, verbose=False):
+    """Internal function to look up the targetIDs of several GRB names.
+
+    Names that have not already been resolved are looked up with a
+    single call to the server, and the successful lookups are cached as
+    in ``_resolveName()``.
+
+    Parameters
+    ----------
+
+    GRBNames : list or tuple
+        The names of the GRBs (e.g. ["GRB 060729", "GRB 080319B"])
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    dict or None
+        The targetID of each GRB, indexed by name, with ``None`` for
+        GRBs which were not found; or ``None`` if the names could not be
+        resolved in one call, in which case they must be resolved one
+        at a time.
+
+    """
+    global _batchNamesSupported
+
+    ret = {n: _resolvedNames[n] for n in GRBNames if n in _resolvedNames}
+    todo = [n for n in dict.fromkeys(GRBNames) if n not in ret]
+    if len(todo) == 0:
+        return ret
+    if (not _batchNamesSupported) or (len(todo) < 2):
+        return None
+
+    sendData = {"names": todo}
+    try:
+        tmp = base.submitAPICall("GRBNamesToTargetIDs", sendData, verbose=verbose, skipErrors=True)
+    except (RuntimeError, OSError, ValueError) as e:
+        # An HTTP or connection failure; rather than paying for another
+        # failed call on every later lookup, don't try again this
+        # session.
+        _batchNamesSupported = False
+        if verbose:
+            print(f"Batch name resolution failed ({e}); resolving names one at a time.")
+        return None
+
+    if "targetIDs" not in tmp:
+        # If the server rejected the call outright, it doesn't support
+        # batch lookups, so don't try again this session.
+        if _isUnsupportedReply(tmp, "GRBNamesToTargetIDs"):
+            _batchNamesSupported = False
+        if verbose:
+            print("Could not resolve the names in one call; resolving them one at a time.")
+        return None
+
+    for n in todo:
+        t = tmp["targetIDs"].get(n)
+        if t is not None:
+            _resolvedNames[n] = t
+        ret[n] = t
+    return ret
+
+
+@base._verboseImpliesNotSilent
 def GRBNameToTargetID(GRBName, silent=True, verbose=False):
     """Convert a GRB name into a targetID
 
+    Names are only looked up on the server the first time they are
+    successfully resolved in a session;
+    ``GRBNameToTargetID.cache_clear()`` will empty this cache.
+
     Parameters
     ----------
 
@@ -39,21 +167,59 @@ def GRBNameToTargetID(GRBName, silent=True, verbose=False):
         ``None``
 
     """
-    if verbose:
-        silent = False
-
-    sendData = {"name": GRBName}
-    tmp = base.submitAPICall("GRBNameToTargetID", sendData, verbose=verbose)
-    if "NOTFOUND" in tmp:
+    targetID = _resolveName(GRBName, verbose=verbose)
+    if targetID is None:
         if not silent:
             print(f"No confirmed GRB with name `{GRBName}` found in the XRT catalogue.")
         return None
-    if "targetID" in tmp:
-        if not silent:
-            print(f"Resolved `{GRBName}` as `{tmp['targetID']}`.")
-        return tmp["targetID"]
-    else:
-        raise RuntimeError("Unknown error; unexpected return; is your swifttools version up to date?")
+    if not silent:
+        print(f"Resolved `{GRBName}` as `{targetID}`.")
+    return targetID
+
+
+GRBNameToTargetID.cache_clear = _resolvedNames.clear
+
+
+@base._verboseImpliesNotSilent
+def GRBNamesToTargetIDs(GRBNames, silent=True, verbose=False):
+    """Convert a list of GRB names into targetIDs
+
+    All of the names that have not already been resolved are resolved
+    with a single call to the server. If the server does not support
+    this, each name is resolved in turn via ``GRBNameToTargetID()``.
+
+    Parameters
+    ----------
+
+    GRBNames : list or tuple
+        The names of the GRBs (e.g. ["GRB 060729", "GRB 080319B"])
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    dict
+        The targetID of each GRB, indexed by name. GRBs which were not
+        found have a value of ``None``.
+
+    """
+    resolved = _resolveNames(GRBNames, verbose=verbose)
+    if resolved is None:
+        return {n: GRBNameToTargetID(n, silent=silent, verbose=verbose) for n in GRBNames}
+
+    if not silent:
+        for n in dict.fromkeys(GRBNames):
+            t = resolved[n]
+            if t is None:
+                print(f"No confirmed GRB with name `{n}` found in the XRT catalogue.")
+            else:
+                print(f"Resolved `{n}` as `{t}`.")
+    return resolved
 
 
 def _handleGRBListArgument(targetID, GRBName, silent=True, verbose=False):
@@ -64,6 +230,11 @@ def _handleGRBListArgument(targetID, GRBName, silent=True, verbose=False):
     into a list if necessary. It also returns a look up of the targetID
     against the input key, which may of course just be the targetID!
 
+    Each targetID appears only once in the returned list, even if it
+    was requested more than once (e.g. via two names for the same GRB);
+    all of the keys that resolved to it are given in the ``aliases``
+    dict, so that callers can fan the results back out.
+
     Parameters
     ----------
 
@@ -92,6 +263,10 @@ def _handleGRBListArgument(targetID, GRBName, silent=True, verbose=False):
     single: bool
         Whether a single value, instead of a list, was supplied.
 
+    aliases : dict
+        A lookup of targetID against a list of all the keys that were
+        supplied for it.
+
     """
     if verbose:
         silent = False
@@ -100,39 +275,45 @@ def _handleGRBListArgument(targetID, GRBName, silent=True, verbose=False):
         raise ValueError("Exactly one of `targetID` or `GRBName` must be set.")
 
     varVal = None
-    lookup = {}
     single = False
 
     if GRBName is not None:
         # Have to convert to targetID
         if isinstance(GRBName, (list, tuple)):
-            varVal = []
-            for n in GRBName:
-                tmp = GRBNameToTargetID(n, silent=silent, verbose=verbose)
-                varVal.append(tmp)
-                lookup[tmp] = n
+            resolved = GRBNamesToTargetIDs(GRBName, silent=silent, verbose=verbose)
+            varVal = [resolved[n] for n in GRBName]
+            keys = GRBName
         else:
             tmp = GRBNameToTargetID(GRBName, silent=silent, verbose=verbose)
             varVal = [tmp]
             single = True
-            lookup[tmp] = GRBName
+            keys = [GRBName]
 
     else:
         if isinstance(targetID, (list, tuple)):
             varVal = targetID
-            lookup = dict(zip(targetID, targetID))
         else:
             varVal = [targetID]
             single = True
-            lookup[targetID] = targetID
+        keys = varVal
 
-    return (varVal, lookup, single)
+    # Only get each target once, but remember every key it was asked for by.
+    aliases = {}
+    for t, k in zip(varVal, keys):
+        tKeys = aliases.setdefault(t, [])
+        if k not in tKeys:
+            tKeys.append(k)
+    varVal = list(aliases.keys())
+    lookup = {t: k[0] for t, k in aliases.items()}
+
+    return (varVal, lookup, single, aliases)
 
 
 # --------------------------------------------------------------------
 # Light curve access
 
 
+@base._verboseImpliesNotSilent
 def getLightCurves(
     targetID=None,
     GRBName=None,
@@ -142,6 +323,7 @@ def getLightCurves(
     subDirs=True,
     silent=True,
     verbose=False,
+    maxWorkers=8,
     **kwargs,
 ):
     """Download a GRB light curve / set of light curves.
@@ -190,6 +372,9 @@ def getLightCurves(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of GRBs to download at once (default: 8).
+
     **kwargs: dict
         Arguments passed to ``download._getLightCurve``.
 
@@ -200,51 +385,75 @@ def getLightCurves(
         above.
 
     """
-    if verbose:
-        silent = False
+    if not (saveData or returnData):
+        raise ValueError("Nothing to do: at least one of `saveData` and `returnData` must be True.")
 
     # Handle the arguments into a list, and whether we are getting a
     # single thing.
-    targetIDs, lookup, single = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
+    targetIDs, lookup, single, aliases = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
 
     # I don't want the prefix argument to be passable in here; it is set
     # by this function, so check for it:
     if "prefix" in kwargs:
         raise ValueError("You cannot set `prefix` for getLightCurves()")
 
-    if saveData:
-        base._createDir(destDir, silent=silent, verbose=verbose)
-
     ret = {}
 
+    # Work out where everything goes, and make the directories, before
+    # starting the (parallel) downloads.
+    # Each target is only downloaded once, but if it was requested under
+    # more than one name it is saved under each of them.
+    jobs = []
+    dirs = [destDir] if saveData else []
+    destPrefix = f"{destDir}/"
     for t in targetIDs:
-        # We are not necessarily using the targetID as the index; what
-        # do we want.
-        outDir = destDir
-        prefix = ""
-        key = lookup[t]
+        locations = []
+        for key in aliases[t]:
+            # We are not necessarily using the targetID as the index; what
+            # do we want.
+            outDir = destDir
+            prefix = ""
+            if saveData and subDirs and not single:
+                outDir = destPrefix + str(key)
+                dirs.append(outDir)
+            elif not single:
+                prefix = f"{key}_"
+            locations.append((outDir, prefix))
+        jobs.append((t, lookup[t], locations))
+
+    # Parents come before their subdirectories in this list.
+    for d in dict.fromkeys(dirs):
+        base._createDir(d, silent=silent, verbose=verbose)
+
+    def _getOne(job):
+        t, key, locations = job
         if verbose:
             print(f"Getting {key}")
-        if saveData and subDirs and not single:
-            outDir = f"{destDir}/{key}"
-            base._createDir(outDir, silent=silent, verbose=verbose)
-        elif not single:
-            prefix = f"{key}_"
-
+        outDir, prefix = locations[0]
+        # The URLs are needed to save the light curve again under any
+        # other names, and are only returned with the data.
         tmp = dl._getLightCurve(
             type="GRB",
             objectID=t,
             prefix=prefix,
-            returnData=returnData,
+            returnData=returnData or (saveData and len(locations) > 1),
             saveData=saveData,
             destDir=outDir,
             silent=silent,
             verbose=verbose,
             **kwargs,
         )
+        if saveData and (len(locations) > 1) and ("URLs" in tmp):
+            for outDir, prefix in locations[1:]:
+                dl._saveLightCurveFromURL(tmp, destDir=outDir, prefix=prefix, silent=silent, verbose=verbose, **kwargs)
+        return tmp if returnData else None
+
+    results = base._runParallel(_getOne, jobs, maxWorkers=maxWorkers)
 
-        if returnData:
-            ret[key] = tmp
+    if returnData:
+        for job, tmp in zip(jobs, results):
+            for key in aliases[job[0]]:
+                ret[key] = tmp
 
     if returnData:
         if single:
@@ -285,7 +494,10 @@ def saveLightCurves(data, destDir="lc", whichGRBs="all", subDirs=True, **kwargs)
         otherwise all have the same names (default: ``True``).
 
     **kwargs : dict, optional
-        Other arguments to pass to _saveLightCurveFromDict()
+        Other arguments to pass to _saveLightCurveFromDict(), such as
+        ``format='parquet'`` to save Parquet rather than text files.
+        You can also set ``maxWorkers``, the maximum number of GRBs to
+        save at once (default: 8).
 
     """
     if "silent" in kwargs:
@@ -313,9 +525,14 @@ def saveLightCurves(data, destDir="lc", whichGRBs="all", subDirs=True, **kwargs)
 
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # Which sources am I saving?
+    # Which sources am I saving? Check they all exist before saving any.
     if (whichGRBs is None) or (whichGRBs == "all"):
-        whichGRBs = data.keys()
+        whichGRBs = list(data.keys())
+    else:
+        whichGRBs = list(dict.fromkeys(whichGRBs))
+        missing = [g for g in whichGRBs if g not in data]
+        if len(missing) > 0:
+            raise ValueError(f"The following are not in the light curve list: {missing}")
 
     # For GRBs we don't add the time or binning to the extension unless requested
     if "timeFormatInFname" not in kwargs:
@@ -325,26 +542,35 @@ def saveLightCurves(data, destDir="lc", whichGRBs="all", subDirs=True, **kwargs)
 
     # prefix should not be in this dict, so remove if it is.
     kwargs.pop("prefix", None)
+    maxWorkers = kwargs.pop("maxWorkers", 8)
 
-    # Now start saving light curves, one source at a time
+    # Work out where each source goes, and create the directories here
+    # rather than in the (parallel) save calls.
+    jobs = []
+    destPrefix = f"{destDir}/"
     for source in whichGRBs:
-        if source not in data:
-            raise ValueError(f"{source} is not in the light curve list.")
-
         path = destDir
         prefix = ""
         if subDirs:
-            path = f"{destDir}/{source}"
+            path = destPrefix + str(source)
+            base._createDir(path, silent=silent, verbose=verbose)
         elif usePrefix:
             prefix = f"{source}_"
+        jobs.append((source, path, prefix))
 
+    # Now save the light curves; this is all disk I/O so we can do several sources at once.
+    def _saveOne(job):
+        source, path, prefix = job
         dl._saveLightCurveFromDict(data[source], destDir=path, prefix=prefix, **kwargs)
 
+    base._runParallel(_saveOne, jobs, maxWorkers=maxWorkers)
+
 
 # --------------------------------------------------------------------
 # REBIN functions
 
 
+@base._verboseImpliesNotSilent
 def rebinLightCurve(GRBName=None, targetID=None, silent=True, verbose=False, **kwargs):
     """Rebin a GRB light curve.
 
@@ -379,9 +605,6 @@ def rebinLightCurve(GRBName=None, targetID=None, silent=True, verbose=False, **k
         The job identifier, which is needed to retrieve your data.
 
     """
-    if verbose:
-        silent = False
-
     if (targetID is None) == (GRBName is None):
         raise ValueError("Exactly one of `GRBName` or `targetID` must be set.")
 
@@ -400,13 +623,10 @@ def rebinLightCurve(GRBName=None, targetID=None, silent=True, verbose=False, **k
     return dl._rebinLightCurve("GRB", targetID, silent=silent, verbose=verbose, **kwargs)
 
 
+@base._verboseImpliesNotSilent
 def checkRebinStatus(JobID, silent=True, verbose=False):
     """Check the status of a rebin job."""
-    if verbose:
-        silent = False
-
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     return dl._checkRebinStatus(JobID, silent=silent, verbose=verbose)
 
@@ -426,13 +646,69 @@ def rebinComplete(JobID):
     bool
         Whether the job is complete or not.
 
+    Notes
+    -----
+    To wait for a job to complete, use ``waitForRebin()`` rather than
+    calling this function in a loop.
+
     """
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     return dl._rebinComplete(JobID)
 
 
+@base._verboseImpliesNotSilent
+def waitForRebin(JobID, maxWait=3600, initialPoll=1.0, maxPoll=30.0, silent=True, verbose=False):
+    """Wait for a rebin job to complete.
+
+    This checks the job status repeatedly, leaving an increasing
+    interval between checks, until the job is complete, has failed, or
+    ``maxWait`` seconds have elapsed.
+
+    Parameters
+    ----------
+
+    JobID : int
+        The Job ID.
+
+    maxWait : float, optional
+        The maximum time to wait, in seconds (default: 3600).
+
+    initialPoll : float, optional
+        The interval before the first re-check, in seconds
+        (default: 1).
+
+    maxPoll : float, optional
+        The maximum interval between checks, in seconds (default: 30).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    bool
+        Whether the job completed within ``maxWait``; ``False`` if it
+        failed.
+
+    """
+    JobID = base._requireInt("JobID", JobID)
+
+    return dl._waitForJob(
+        dl._checkRebinStatus,
+        JobID,
+        maxWait=maxWait,
+        initialPoll=initialPoll,
+        maxPoll=maxPoll,
+        silent=silent,
+        verbose=verbose,
+    )
+
+
+@base._verboseImpliesNotSilent
 def cancelRebin(JobID, silent=True, verbose=False):
     """Cancels a rebin job.
 
@@ -461,8 +737,7 @@ def cancelRebin(JobID, silent=True, verbose=False):
             :A textual description of the job status.
 
     """
-    if verbose:
-        silent = False
+    JobID = base._requireInt("JobID", JobID)
 
     return dl._cancelRebin(JobID, silent=silent, verbose=verbose)
 
@@ -476,6 +751,8 @@ def getRebinnedLightCurve(JobID, **kwargs):
     For details of the kwargs, see the online documentation, or the help
     for the above function.
     """
+    JobID = base._requireInt("JobID", JobID)
+
     if not rebinComplete(JobID):
         raise RuntimeError("Cannot get light curves; this job is not complete.")
 
@@ -489,6 +766,7 @@ def getRebinnedLightCurve(JobID, **kwargs):
 # Spectrum access
 
 
+@base._verboseImpliesNotSilent
 def getSpectra(
     targetID=None,
     GRBName=None,
@@ -500,6 +778,7 @@ def getSpectra(
     subDirs=True,
     silent=True,
     verbose=False,
+    maxWorkers=8,
     **kwargs,
 ):
     """Download a GRB spectrum / set of spectra.
@@ -550,6 +829,11 @@ def getSpectra(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of GRBs to download at once; if only one GRB
+        is requested, the maximum number of its files to download at
+        once (default: 8).
+
     **kwargs: dict
         Arguments passed to ``download._getLightCurve``.
 
@@ -560,8 +844,8 @@ def getSpectra(
         above.
 
     """
-    if verbose:
-        silent = False
+    if not (saveData or saveImages or returnData):
+        raise ValueError("Nothing to do: at least one of `saveData`, `saveImages` and `returnData` must be True.")
 
     if saveData and not subDirs and ("extract" in kwargs) and kwargs["extract"]:
         raise RuntimeError("You cannot have subDirs as False if you are extracting data.")
@@ -570,60 +854,98 @@ def getSpectra(
     # single thing.
     isTimeSlice = False
     if JobID is not None:
-        if not isinstance(JobID, int):
-            raise ValueError("`JobID` should be an int")
+        JobID = base._requireInt("JobID", JobID)
         targetIDs = (JobID,)
         lookup = {JobID: JobID}
+        aliases = {JobID: [JobID]}
         single = True
         isTimeSlice = True
     else:
-        targetIDs, lookup, single = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
+        targetIDs, lookup, single, aliases = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
         isTimeSlice = False
 
     # I don't want the prefix argument to be passable in here; it is set
     # by this function, so check for it:
 
-    if saveData or saveImages:
-        base._createDir(destDir, silent=silent, verbose=verbose)
-
     ret = {}
-    sendData = {"type": "GRB"}
+    specType = "GRB"
     if isTimeSlice:
-        sendData["type"] = "timeslice"
-
+        specType = "timeslice"
+
+    # Work out where everything goes, and make the directories, before
+    # starting the (parallel) downloads.
+    # Each target is only downloaded once, but if it was requested under
+    # more than one name it is saved under each of them.
+    jobs = []
+    dirs = [destDir] if (saveData or saveImages) else []
+    destPrefix = f"{destDir}/"
     for t in targetIDs:
-        # We are not necessarily using the targetID as the index; what
-        # do we want.
-        prefix = ""
-        outDir = destDir
-        key = lookup[t]
+        locations = []
+        for key in aliases[t]:
+            # We are not necessarily using the targetID as the index; what
+            # do we want.
+            prefix = ""
+            outDir = destDir
+            if saveData and subDirs and not single:
+                outDir = destPrefix + str(key)
+                dirs.append(outDir)
+            elif not single:
+                prefix = f"{key}_"
+            locations.append((outDir, prefix))
+        jobs.append((t, lookup[t], locations))
+
+    # Parents come before their subdirectories in this list.
+    for d in dict.fromkeys(dirs):
+        base._createDir(d, silent=silent, verbose=verbose)
+
+    # Get the spectral information for all of the targets in one call,
+    # if the server supports that.
+    batch = _getSpectraBatch(specType, targetIDs, verbose=verbose)
+
+    # Save each GRB's files one at a time, rather than starting another
+    # pool of threads inside each of the download threads.
+    innerWorkers = maxWorkers if len(jobs) == 1 else 1
+
+    def _getOne(job):
+        t, key, locations = job
         if verbose:
             print(f"Getting {key}")
-        if saveData and subDirs and not single:
-            outDir = f"{destDir}/{key}"
-            base._createDir(outDir, silent=silent, verbose=verbose)
-        elif not single:
-            prefix = f"{key}_"
 
         # Now, first get the data:
-        sendData["objectID"] = t
-
-        tmp = base.submitAPICall("downloadSpectrum", sendData, verbose=verbose)
+        entry = batch.get(str(t)) if batch is not None else None
+        if (entry is not None) and ("ERROR" not in entry):
+            tmp = base.APIResult(entry)
+            # The entries in a batch reply have no "OK" key of their own;
+            # the batch call as a whole succeeded.
+            if tmp.status is base.APIStatus.ERROR:
+                tmp.status = base.APIStatus.OK
+        else:
+            # Not batched, or the batch reply has nothing usable for this
+            # object, so request it on its own; that reports any error.
+            sendData = {"type": specType, "objectID": t}
+            tmp = base.submitAPICall("downloadSpectrum", sendData, verbose=verbose)
+
+        if (saveData or saveImages) and tmp.status is not base.APIStatus.NODATA:
+            for outDir, prefix in locations:
+                dl._saveSpectrum(
+                    tmp,
+                    saveData=saveData,
+                    saveImages=saveImages,
+                    prefix=prefix,
+                    destDir=outDir,
+                    maxWorkers=innerWorkers,
+                    silent=silent,
+                    verbose=verbose,
+                    **kwargs,
+                )
+        return tmp
 
-        if (saveData or saveImages) and "NoSpectrum" not in tmp:
-            dl._saveSpectrum(
-                tmp,
-                saveData=saveData,
-                saveImages=saveImages,
-                prefix=prefix,
-                destDir=outDir,
-                silent=silent,
-                verbose=verbose,
-                **kwargs,
-            )
+    results = base._runParallel(_getOne, jobs, maxWorkers=maxWorkers)
 
-        if returnData:
-            ret[key] = tmp
+    if returnData:
+        for job, tmp in zip(jobs, results):
+            for key in aliases[job[0]]:
+                ret[key] = tmp
 
     if returnData:
         if single:
@@ -632,7 +954,90 @@ def getSpectra(
             return ret
 
 
-def saveSpectra(data, destDir="spec", whichGRBs="all", silent=True, verbose=False, **kwargs):
+def _isUnsupportedReply(reply, func):
+    """Internal function to check whether the server rejected a function.
+
+    Parameters
+    ----------
+
+    reply : dict
+        The data returned by the server.
+
+    func : str
+        The name of the API function that was called.
+
+    Returns
+    -------
+
+    bool
+        Whether the server said that it does not support ``func`` at
+        all, as opposed to the call failing for some other reason.
+
+    """
+    if "multiNotSupported" in reply:
+        return True
+    if "ERROR" not in reply:
+        return False
+    msg = f"{reply['ERROR']} {reply.get('ERRORTEXT', '')}".lower()
+    return (func.lower() in msg) or ("not supported" in msg) or ("unknown" in msg)
+
+
+def _getSpectraBatch(specType, targetIDs, verbose=False):
+    """Internal function to get the spectra of several objects at once.
+
+    This gets the spectral information for all of the objects in a
+    single API call.
+
+    Parameters
+    ----------
+
+    specType : str
+        The type of object ('GRB' or 'timeslice').
+
+    targetIDs : list or tuple
+        The object identifiers.
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    dict or None
+        The spectral information for each object, indexed by the
+        object identifier as a string; or ``None`` if only one object
+        was requested or the server does not support batch requests, in
+        which case the objects must be requested one at a time.
+
+    """
+    global _batchSpectraSupported
+
+    if (not _batchSpectraSupported) or (len(targetIDs) < 2):
+        return None
+
+    sendData = {"type": specType, "objectIDs": list(targetIDs)}
+    try:
+        tmp = base.submitAPICall("downloadSpectra", sendData, verbose=verbose, skipErrors=True)
+    except (RuntimeError, OSError, ValueError) as e:
+        # A transient failure, so just don't use batching this time.
+        if verbose:
+            print(f"Batch spectrum request failed ({e}); getting spectra one at a time.")
+        return None
+
+    if "Spectra" not in tmp:
+        # Only stop trying for the rest of the session if the server
+        # says it doesn't support the call at all.
+        if _isUnsupportedReply(tmp, "downloadSpectra"):
+            _batchSpectraSupported = False
+        if verbose:
+            print("Could not get the spectra in one call; getting them one at a time.")
+        return None
+
+    return tmp["Spectra"]
+
+
+@base._verboseImpliesNotSilent
+def saveSpectra(data, destDir="spec", whichGRBs="all", silent=True, verbose=False, maxWorkers=8, **kwargs):
     """Save the spectral data to disk.
 
     This will download and save the spectral files from a previous
@@ -657,13 +1062,15 @@ def saveSpectra(data, destDir="spec", whichGRBs="all", silent=True, verbose=Fals
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of GRBs to save at once; if only one GRB is
+        being saved, the maximum number of its files to download at
+        once (default: 8).
+
     **kwargs : dict, optional
-        Arguments to pass to ``download.dl._saveSpectrum()``
+        Arguments to pass to ``download.dl._saveSpectrum()``.
 
     """
-    if verbose:
-        silent = False
-
     # Little hack needed here to handle the case that we have only a single spectrum, not a dict of LCs
     # We will know this because it will have the 'Datasets' key
     single = False
@@ -675,14 +1082,20 @@ def saveSpectra(data, destDir="spec", whichGRBs="all", silent=True, verbose=Fals
     # Create the output dir, if needed.
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # Which sources am I saving?
+    # Which sources am I saving? Check they all exist before saving any.
     if (whichGRBs is None) or (whichGRBs == "all"):
-        whichGRBs = data.keys()
-
-    # Now start saving light curves, one source at a time
+        whichGRBs = list(data.keys())
+    else:
+        whichGRBs = list(dict.fromkeys(whichGRBs))
+        missing = [g for g in whichGRBs if g not in data]
+        if len(missing) > 0:
+            raise ValueError(f"The following are not in the spectra available: {missing}")
+
+    # Work out where each source goes, and create the directories here
+    # rather than in the (parallel) save calls.
+    jobs = []
+    destPrefix = f"{destDir}/"
     for source in whichGRBs:
-        if source not in data:
-            raise ValueError(f"{source} is not in the spectra available.")
         if "NoSpectrum" in data[source]:
             if not silent:
                 print(f"Source `{source}` has no spectra.")
@@ -690,16 +1103,27 @@ def saveSpectra(data, destDir="spec", whichGRBs="all", silent=True, verbose=Fals
 
         path = destDir
         if not single:
-            path = f"{destDir}/{source}"
+            path = destPrefix + str(source)
             base._createDir(path, silent=silent, verbose=verbose)
+        jobs.append((source, path))
+
+    # Now save the spectra, several sources at a time. Each source's
+    # files are then saved one at a time, rather than starting another
+    # pool of threads for each source.
+    innerWorkers = maxWorkers if len(jobs) == 1 else 1
+
+    def _saveOne(job):
+        source, path = job
+        dl._saveSpectrum(data[source], destDir=path, maxWorkers=innerWorkers, silent=silent, verbose=verbose, **kwargs)
 
-        dl._saveSpectrum(data[source], destDir=path, silent=silent, verbose=verbose, **kwargs)
+    base._runParallel(_saveOne, jobs, maxWorkers=maxWorkers)
 
 
 # --------------------------------------------------------------------
 # TIMESLICE functions
 
 
+@base._verboseImpliesNotSilent
 def timesliceSpectrum(
     GRBName=None, targetID=None, slices=None, mode="BOTH", redshift=None, grades="all", silent=True, verbose=False
 ):
@@ -795,9 +1219,6 @@ def timesliceSpectrum(
         The job identifier, which is needed to retrieve your data.
 
     """
-    if verbose:
-        silent = False
-
     if (targetID is None) == (GRBName is None):
         raise ValueError("Exactly one of `GRBName` or `targetID` must be set.")
 
@@ -819,24 +1240,18 @@ def timesliceSpectrum(
     # Need to parse the slices dict
     if not isinstance(slices, dict):
         raise ValueError("`slices` must be a dict")
-    times = []
-    rnames = []
-    modes = []
 
-    for name, slice in slices.items():
+    def _parseSlice(name, slice):
         if isinstance(slice, str):
-            rnames.append(name)
-            times.append(slice)
-            modes.append(mode)
-        elif isinstance(slice, (list, tuple)):
-            rnames.append(name)
-            times.append(slice[0])
-            if len(slice) > 1:
-                modes.append(slice[1])
-            else:
-                modes.append(mode)
-        else:
-            raise ValueError(f"Slice entry `{name}` is invalid.")
+            return (slice, mode)
+        if isinstance(slice, (list, tuple)):
+            return (slice[0], slice[1] if len(slice) > 1 else mode)
+        raise ValueError(f"Slice entry `{name}` is invalid.")
+
+    rnames = list(slices.keys())
+    parsed = [_parseSlice(name, slice) for name, slice in slices.items()]
+    times = [p[0] for p in parsed]
+    modes = [p[1] for p in parsed]
 
     # print(f"Going to call with:\nrnames: {rnames}\ntimes:{times}\nmodes:{modes}")
 
@@ -868,6 +1283,7 @@ def timesliceSpectrum(
     # return dl._rebinLightCurve("GRB", targetID, binMeth=binMeth, silent=silent, verbose=verbose, **kwargs)
 
 
+@base._verboseImpliesNotSilent
 def checkTimesliceStatus(JobID, silent=True, verbose=False):
     """Check the status of a timeslice spectrum job.
 
@@ -896,14 +1312,7 @@ def checkTimesliceStatus(JobID, silent=True, verbose=False):
             :A textual description of the job status.
 
     """
-    if verbose:
-        silent = False  # noqa
-
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
-
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     sendData = {"JobID": JobID}
     tmp = base.submitAPICall("checkSliceStatus", sendData, verbose=verbose, minKeys=("status", "text"))
@@ -927,9 +1336,13 @@ def timesliceComplete(JobID):
     bool
         Whether the job is complete or not.
 
+    Notes
+    -----
+    To wait for a job to complete, use ``waitForTimeslice()`` rather
+    than calling this function in a loop.
+
     """
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     tmp = checkTimesliceStatus(JobID, silent=True, verbose=False)
 
@@ -939,6 +1352,58 @@ def timesliceComplete(JobID):
         return False
 
 
+@base._verboseImpliesNotSilent
+def waitForTimeslice(JobID, maxWait=3600, initialPoll=1.0, maxPoll=30.0, silent=True, verbose=False):
+    """Wait for a timeslice spectrum job to complete.
+
+    This checks the job status repeatedly, leaving an increasing
+    interval between checks, until the job is complete, has failed, or
+    ``maxWait`` seconds have elapsed.
+
+    Parameters
+    ----------
+
+    JobID : int
+        The Job ID.
+
+    maxWait : float, optional
+        The maximum time to wait, in seconds (default: 3600).
+
+    initialPoll : float, optional
+        The interval before the first re-check, in seconds
+        (default: 1).
+
+    maxPoll : float, optional
+        The maximum interval between checks, in seconds (default: 30).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    bool
+        Whether the job completed within ``maxWait``; ``False`` if it
+        failed.
+
+    """
+    JobID = base._requireInt("JobID", JobID)
+
+    return dl._waitForJob(
+        checkTimesliceStatus,
+        JobID,
+        maxWait=maxWait,
+        initialPoll=initialPoll,
+        maxPoll=maxPoll,
+        silent=silent,
+        verbose=verbose,
+    )
+
+
+@base._verboseImpliesNotSilent
 def cancelTimeslice(JobID, silent=True, verbose=False):
     """Cancels a timeslice job.
 
@@ -967,19 +1432,12 @@ def cancelTimeslice(JobID, silent=True, verbose=False):
             :A textual description of the job status.
 
     """
-    if verbose:
-        silent = False
-
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
-
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     sendData = {"JobID": JobID}
     tmp = base.submitAPICall("cancelSlice", sendData, verbose=verbose, skipErrors=True)
 
-    if "OK" in tmp:
+    if tmp.status is base.APIStatus.OK:
         return True
     else:
         if verbose or not silent:
@@ -991,6 +1449,7 @@ def cancelTimeslice(JobID, silent=True, verbose=False):
 # Burst Analyser access
 
 
+@base._verboseImpliesNotSilent
 def getBurstAnalyser(
     targetID=None,
     GRBName=None,
@@ -1008,6 +1467,9 @@ def getBurstAnalyser(
     skipErrors=False,
     silent=True,
     verbose=False,
+    useCache=False,
+    cacheTTL=None,
+    maxWorkers=8,
     **kwargs,
 ):
     """Download and/or save burst analyser data.
@@ -1123,6 +1585,23 @@ def getBurstAnalyser(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    useCache : bool, optional
+        Whether to keep the data downloaded from the server in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable
+        (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
+    maxWorkers : int, optional
+        The maximum number of GRBs to download at once; if only one GRB
+        is requested, the maximum number of its files to save at once
+        (default: 8).
+
     **kwargs : dict, optional
         If ``saveData=True``, any arguments to pass to
         ``saveSingleBurstAn()``.
@@ -1134,129 +1613,236 @@ def getBurstAnalyser(
         complex mess (EDIT ME).
 
     """
-    if verbose:
-        silent = False
+    if not (saveData or downloadTar or returnData):
+        raise ValueError("Nothing to do: at least one of `saveData`, `downloadTar` and `returnData` must be True.")
 
     # Handle the arguments into a list, and whether we are getting a
     # single thing.
-    targetIDs, lookup, single = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
-
-    if saveData or downloadTar:
-        base._createDir(destDir, silent=silent, verbose=verbose)
+    targetIDs, lookup, single, aliases = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
 
     ret = {}
+
+    # Work out where everything goes, and make the directories, before
+    # starting the (parallel) downloads.
+    # Each target is only downloaded once, but if it was requested under
+    # more than one name it is saved under each of them.
+    jobs = []
+    dirs = [destDir] if (saveData or downloadTar) else []
+    useSubDirs = subDirs and (saveData or downloadTar) and (not single)
     for t in targetIDs:
-        key = lookup[t]
+        locations = []
+        for key in aliases[t]:
+            path = destDir
+            if useSubDirs:
+                path = os.path.join(destDir, str(key))
+                dirs.append(path)
+
+            tarPath = None
+            if downloadTar:
+                tarPath = path
+                if saveData:
+                    tarPath = os.path.join(path, "fromTar")
+                    # targPath above may not be unique, needs to be
+                    if (not single) and (not subDirs):
+                        tarPath = os.path.join(path, f"{key}_fromTar")
+                dirs.append(tarPath)
+
+            locations.append((key, path, tarPath))
+
+        jobs.append((t, lookup[t], locations))
+
+    # Parents come before their subdirectories in this list.
+    for d in dict.fromkeys(dirs):
+        base._createDir(d, silent=silent, verbose=verbose)
+
+    def _getOne(job):
+        t, key, locations = job
         if verbose:
             print(f"Getting {key} ({t})")
 
-        path = destDir
-        if subDirs and (saveData or downloadTar) and (not single):
-            path = f"{destDir}/{key}"
-            base._createDir(path, silent=silent, verbose=verbose)
-
         # Tar file first - relatively easy:
         if downloadTar:
-            tarPath = path
-            if saveData:
-                tarPath = f"{path}/fromTar"
-                # targPath above may not be unique, needs to be
-                if (not single) and (not subDirs):
-                    tarPath = f"{path}/{key}_fromTar"
-
             # OK, now get the URL
             sendData = {"targetID": t}
             tmp = base.submitAPICall("getBurstAnalyserTarURL", sendData, verbose=verbose, minKeys=("URL",))
 
-            # Create the path
-            base._createDir(tarPath, silent=silent, verbose=verbose)
-
             # And get the tar data:
-            ok = dl._saveTar(tmp["URL"], tarPath, strip=True, clobber=clobber, silent=silent, verbose=verbose, **kwargs)
-            if not (ok or skipErrors):
-                raise RuntimeError(f"Failed getting tar for {key}")
-
-        if saveData or returnData:
-            sendData = {
-                "targetID": t,
-                "instruments": instruments,
-                "bands": bands,
-                "BATBinning": BATBinning,
-                "incbad": incbad,
-                "nosys": nosys,
-            }
-            tmp = base.submitAPICall("downloadBurstAnalyser", sendData, verbose=verbose, minKeys=("Instruments",))
-
-            # If we are getting multiple light curves, and no subdirs, then the file names will need prefixes.
-            prefix = ""
-            if (not subDirs) and (not single):
-                prefix = key
-
-            # Trying to do the handle Light Curve thing is a pain, because
-            # that function returns something new, it does not edit in place.
-            # I'm not sure how I can make it edit in place, so I'm going to have to do this
-            # a crap way, for now at least.
-
-            if "BAT" in tmp["Instruments"]:
-                # handle HR data direct
-                if "HRData" in tmp["BAT"]:
-                    tmp["BAT"]["HRData"] = pd.DataFrame(
-                        tmp["BAT"]["HRData"]["data"], columns=tmp["BAT"]["HRData"]["columns"], dtype=float
-                    )
-
-                for b in tmp["BAT"]["Binning"]:
-                    tmp["BAT"][b] = dl._handleLightCurve(tmp["BAT"][b], silent=silent, verbose=verbose)
-                    for d in tmp["BAT"][b]["Datasets"]:
-                        tmp["BAT"][b][d]["BadBin"] = tmp["BAT"][b][d]["BadBin"].astype(bool)
-
-            if "BAT_NoEvolution" in tmp["Instruments"]:
-                for b in tmp["BAT_NoEvolution"]["Binning"]:
-                    tmp["BAT_NoEvolution"][b] = dl._handleLightCurve(
-                        tmp["BAT_NoEvolution"][b], silent=silent, verbose=verbose
-                    )
-                    for d in tmp["BAT_NoEvolution"][b]["Datasets"]:
-                        tmp["BAT_NoEvolution"][b][d]["BadBin"] = tmp["BAT_NoEvolution"][b][d]["BadBin"].astype(bool)
-
-            if "XRT" in tmp["Instruments"]:
-                # handle HR data direct
-                keepMe = {}
-                for m in ("WT", "PC"):
-                    if f"HRData_{m}" in tmp["XRT"]:
-                        # print(f"Handling `HRData_{m}`")
-
-                        keepMe[m] = pd.DataFrame(
-                            tmp["XRT"][f"HRData_{m}"]["data"], columns=tmp["XRT"][f"HRData_{m}"]["columns"], dtype=float
-                        )
-                    # else:
-                    #     print(f"Cannot find `HRData_{m}` in XRT")
-                tmp["XRT"] = dl._handleLightCurve(tmp["XRT"], silent=silent, verbose=verbose)
-                for m in ("WT", "PC"):
-                    if m in keepMe:
-                        tmp["XRT"][f"HRData_{m}"] = keepMe[m]
-
-            if "UVOT" in tmp["Instruments"]:
-                tmp["UVOT"] = dl._handleLightCurve(tmp["UVOT"], silent=silent, verbose=verbose)
-
-            if saveData:
+            for name, path, tarPath in locations:
+                ok = dl._saveTar(
+                    tmp["URL"], tarPath, strip=True, clobber=clobber, silent=silent, verbose=verbose, **kwargs
+                )
+                if not (ok or skipErrors):
+                    raise RuntimeError(f"Failed getting tar for {name}")
+
+        if not (saveData or returnData):
+            return None
+
+        sendData = {
+            "targetID": t,
+            "instruments": instruments,
+            "bands": bands,
+            "BATBinning": BATBinning,
+            "incbad": incbad,
+            "nosys": nosys,
+        }
+        tmp = base._cachedAPICall(
+            "downloadBurstAnalyser",
+            sendData,
+            useCache=useCache,
+            cacheTTL=cacheTTL,
+            verbose=verbose,
+            minKeys=("Instruments",),
+        )
+
+        insts = frozenset(tmp["Instruments"])
+        for inst in _burstAnInstruments:
+            if inst in insts:
+                tmp[inst] = _handleBurstAnInstrument(inst, tmp[inst], silent=silent, verbose=verbose)
+
+        # Save each GRB's data in the worker that fetched it, so that if
+        # the data aren't being returned, at most maxWorkers GRBs' data
+        # are held at once. The files are written one at a time, rather
+        # than starting another pool of threads inside this one.
+        if saveData:
+            for name, path, tarPath in locations:
                 saveSingleBurstAn(
                     tmp,
                     destDir=path,
-                    prefix=prefix,
+                    prefix=name if usePrefix else "",
                     clobber=clobber,
                     skipErrors=skipErrors,
                     silent=silent,
                     verbose=verbose,
+                    maxWorkers=innerWorkers,
                     **kwargs,
                 )
 
-            if returnData:
-                ret[key] = tmp
+        return tmp if returnData else None
+
+    # If we are getting multiple light curves, and no subdirs, then the file names will need prefixes.
+    usePrefix = (not subDirs) and (not single)
+    innerWorkers = maxWorkers if len(jobs) == 1 else 1
+    results = base._runParallel(_getOne, jobs, maxWorkers=maxWorkers)
+
     if returnData:
+        for job, tmp in zip(jobs, results):
+            for key in aliases[job[0]]:
+                ret[key] = tmp
         if single:
             ret = ret[lookup[targetIDs[0]]]
         return ret
 
 
+def _handleBurstAnInstrument(inst, data, silent=True, verbose=False):
+    """Internal function to convert one instrument's burst analyser data.
+
+    The hardness ratio data are converted directly into DataFrames, and
+    the light curves via ``download._handleLightCurve()``; which keys
+    are which, for each instrument, is set by the ``_burstAn*`` module
+    variables.
+
+    Parameters
+    ----------
+
+    inst : str
+        The instrument (a key of the ``Instruments`` entry returned by
+        the API).
+
+    data : dict
+        The data for this instrument, as decoded from JSON.
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    dict
+        The instrument data, with DataFrames in place of the JSON data.
+
+    """
+    # _handleLightCurve() returns a new dict rather than editing in
+    # place, so convert the HR data first and put them back afterwards.
+    hrData = {k: _floatDataFrame(data[k]) for k in _burstAnHRKeys.get(inst, ()) if k in data}
+
+    if inst in _burstAnBinnedInstruments:
+        for b in data["Binning"]:
+            data[b] = dl._handleLightCurve(data[b], boolCols=("BadBin",), silent=silent, verbose=verbose)
+    else:
+        data = dl._handleLightCurve(data, silent=silent, verbose=verbose)
+
+    data.update(hrData)
+    return data
+
+
+def _makeBATTaskBuilder(badBATBins):
+    """Internal function to make the function that prepares BAT data to save.
+
+    Whether bad bins are written is fixed for a given save, so this
+    returns a function specialised for it, which is then used for all
+    of the BAT light curves.
+
+    Parameters
+    ----------
+
+    badBATBins : bool
+        Whether to write out BAT bins flagged as 'bad'.
+
+    Returns
+    -------
+
+    callable
+        A function taking (DataFrame, file name, columns to drop, qdp
+        header, description) and returning the save task for
+        ``saveSingleBurstAn()``.
+
+    """
+    if badBATBins:
+
+        def build(df, fname, drop, qdpH, what):
+            cols = [x for x in df.columns if (x != "BadBin") and (x not in drop)]
+            return (df, fname, cols, qdpH, what)
+
+    else:
+
+        def build(df, fname, drop, qdpH, what):
+            cols = [x for x in df.columns if (x != "BadBin") and (x not in drop)]
+            # Only copy the good rows, and the columns we are going to write.
+            return (df.loc[~df["BadBin"].to_numpy(dtype=bool), cols], fname, cols, qdpH, what)
+
+    return build
+
+
+def _floatDataFrame(raw):
+    """Internal function to build a DataFrame of floats from JSON data.
+
+    The rows are converted to a single 2D numpy array first, which
+    pandas can wrap directly, rather than having pandas work through
+    the list of rows itself.
+
+    Parameters
+    ----------
+
+    raw : dict
+        A dict with 'columns' (the column names) and 'data' (a list of
+        rows) as returned by the API.
+
+    Returns
+    -------
+
+    DataFrame
+        The data.
+
+    """
+    columns = raw["columns"]
+    arr = np.asarray(raw["data"], dtype=np.float64).reshape(-1, len(columns))
+    return pd.DataFrame(arr, columns=columns, copy=False)
+
+
+@base._verboseImpliesNotSilent
 def saveBurstAnalyser(data, destDir="spec", whichGRBs="all", subDirs=True, silent=True, verbose=False, **kwargs):
     """Save the burst analyser data to disk.
 
@@ -1291,9 +1877,6 @@ def saveBurstAnalyser(data, destDir="spec", whichGRBs="all", subDirs=True, silen
         Arguments to pass to ``download.dl._saveSpectrum()``
 
     """
-    if verbose:
-        silent = False
-
     # Little hack needed here to handle the case that we have only a single spectrum, not a dict of LCs
     # We will know this because it will have the 'Datasets' key
     usePrefix = True
@@ -1308,18 +1891,22 @@ def saveBurstAnalyser(data, destDir="spec", whichGRBs="all", subDirs=True, silen
     # Create the output dir, if needed.
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # Which sources am I saving?
+    # Which sources am I saving? Check they all exist before saving any.
     if (whichGRBs is None) or (whichGRBs == "all"):
-        whichGRBs = data.keys()
+        whichGRBs = list(data.keys())
+    else:
+        whichGRBs = list(dict.fromkeys(whichGRBs))
+        missing = [g for g in whichGRBs if g not in data]
+        if len(missing) > 0:
+            raise ValueError(f"The following are not in the light curve list: {missing}")
 
     # Now start saving light curves, one source at a time
+    destPrefix = f"{destDir}/"
     for source in whichGRBs:
-        if source not in data:
-            raise ValueError(f"{source} is not in the light curve list.")
         path = destDir
         prefix = ""
         if subDirs:
-            path = f"{destDir}/{source}"
+            path = destPrefix + str(source)
             base._createDir(path, silent=silent, verbose=verbose)
 
         elif usePrefix:
@@ -1335,6 +1922,7 @@ def saveBurstAnalyser(data, destDir="spec", whichGRBs="all", subDirs=True, silen
         )
 
 
+@base._verboseImpliesNotSilent
 def saveSingleBurstAn(
     data,
     destDir="burstAn",
@@ -1350,6 +1938,7 @@ def saveSingleBurstAn(
     skipErrors=False,
     silent=True,
     verbose=False,
+    maxWorkers=8,
     **kwargs,
 ):
     """Save downloaded burst analyser data to disk.
@@ -1402,7 +1991,8 @@ def saveSingleBurstAn(
         ``False``).
 
     clobber : bool, optional
-        Whether to overwrite files if they exist (default: ``False``).
+        Whether to overwrite files if they exist. If ``False``, files
+        which already exist are skipped (default: ``False``).
 
     skipErrors : bool, optional
         Whether to continue if a problem occurs with one file
@@ -1414,13 +2004,13 @@ def saveSingleBurstAn(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of files to write at once (default: 8).
+
     **kwargs : dict, optional
         Not needed, but stops errors due to the way this can be called.
 
     """
-    if verbose:
-        silent = False
-
     if asQDP:
         if (not silent) and (sep != "\t"):
             print("Setting separator to tab, for 'qdp-style; saving")
@@ -1433,164 +2023,109 @@ def saveSingleBurstAn(
 
     if instruments == "all":
         instruments = data["Instruments"]
+    elif isinstance(instruments, str):
+        instruments = (instruments,)
+    instruments = frozenset(instruments)
 
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # This has to be per instrument as there are small differences between
+    # For QDP, we need to filter the columns to get rid of the unwanted
+    # flux errors; these are the same for every dataset, so work them out now.
+    dropCols = frozenset()
+    if asQDP:
+        removeStem = "WithECFErr"
+        if usePropagatedErrors:
+            removeStem = ""
+        dropCols = frozenset((f"FluxPos{removeStem}", f"FluxNeg{removeStem}"))
+
+    # The QDP headers for the different types of file.
+    hrQDPH = None
+    lcQDPH = None
+    simpleQDPH = None
+    if asQDP:
+        hrQDPH = "READ TERR 1 2 3 4 5 6 7"
+        lcQDPH = "READ TERR 1 2 3 4"
+        simpleQDPH = "READ TERR 1 2"
+
+    # Files that exist already are skipped (unless clobber is set) before
+    # we go to the trouble of preparing their data.
+    def _skip(fname):
+        if clobber or not os.path.exists(fname):
+            return False
+        if not silent:
+            print(f"`{fname}` exists and clobber=False, SKIPPING")
+        return True
+
+    # Work out everything that needs to be saved, as (DataFrame, file
+    # name, columns, qdp header, description) tuples, then save them.
+    # This has to be per instrument as there are small differences between them.
+    tasks = []
     if ("BAT" in data) and ("BAT" in instruments):
-        if "HRData" in data["BAT"]:
-            qdpH = None
-            if asQDP:
-                qdpH = "READ TERR 1 2 3 4 5 6 7"
-
-            cols = data["BAT"]["HRData"].columns.tolist()
-            fname = f"{destDir}/{prefix}BAT_HR{suff}"
-            ok = dl._saveDFToDisk(
-                data["BAT"]["HRData"],
-                fname,
-                cols,
-                header,
-                sep,
-                qdpH,
-                asQDP,
-                clobber=clobber,
-                silent=silent,
-                verbose=verbose,
-            )
-            if not (ok or skipErrors):
-                raise RuntimeError("Failed saving BAT HR data to disk")
-
-        for b in data["BAT"]["Binning"]:
-            for d in data["BAT"][b]["Datasets"]:
-                tmp = data["BAT"][b][d]
-                cols = tmp.columns.tolist()
-                cols = [x for x in cols if x != "BadBin"]
-                fname = f"{destDir}/{prefix}BAT_{b}_{d}{suff}"
-                qdpH = None
-
-                # If we don't want the bad data, filter them:
-                if not badBATBins:
-                    # flake is wrong, is False crashes!
-                    tmp = data["BAT"][b][d][data["BAT"][b][d]["BadBin"] == False]  # noqa: E712
-
-                # For QDP, this gets more complicated, we need to filter the columns to get rid of the unwanted errors
-                if asQDP:
-                    qdpH = "READ TERR 1 2 3 4"
-                    removeStem = "WithECFErr"
-                    if usePropagatedErrors:
-                        removeStem = ""
-                    cols = [x for x in cols if (x != f"FluxPos{removeStem}") and (x != f"FluxNeg{removeStem}")]
-
-                ok = dl._saveDFToDisk(
-                    data["BAT"][b][d],
-                    fname,
-                    cols,
-                    header,
-                    sep,
-                    qdpH,
-                    asQDP,
-                    clobber=clobber,
-                    silent=silent,
-                    verbose=verbose,
-                )
-                if not (ok or skipErrors):
-                    raise RuntimeError("Failed saving BAT data to disk")
-
-    if ("BAT_NoEvolution" in data) and ("BAT" in instruments):
-        for b in data["BAT_NoEvolution"]["Binning"]:
-            for d in data["BAT_NoEvolution"][b]["Datasets"]:
-                tmp = data["BAT_NoEvolution"][b][d]
-                cols = tmp.columns.tolist()
-                cols = [x for x in cols if x != "BadBin"]
-                fname = f"{destDir}/{prefix}BAT_NoEvolution_{b}_{d}{suff}"
-                qdpH = None
-
-                # If we don't want the bad data, filter them:
-                if not badBATBins:
-                    tmp = data["BAT_NoEvolution"][b][d][data["BAT_NoEvolution"][b][d]["BadBin"] == False]  # noqa
-
-                if asQDP:
-                    qdpH = "READ TERR 1 2"
-
-                ok = dl._saveDFToDisk(
-                    data["BAT_NoEvolution"][b][d],
-                    fname,
-                    cols,
-                    header,
-                    sep,
-                    qdpH,
-                    asQDP,
-                    clobber=clobber,
-                    silent=silent,
-                    verbose=verbose,
-                )
-                if not (ok or skipErrors):
-                    raise RuntimeError("Failed saving BAT_NoEvolution data to disk")
+        fname = f"{destDir}/{prefix}BAT_HR{suff}"
+        if ("HRData" in data["BAT"]) and not _skip(fname):
+            tmp = data["BAT"]["HRData"]
+            tasks.append((tmp, fname, tmp.columns.tolist(), hrQDPH, "BAT HR"))
+
+    # The BAT light curves, with and without spectral evolution, are all
+    # handled the same way, just with different columns and QDP headers.
+    if "BAT" in instruments:
+        batTasks = _makeBATTaskBuilder(badBATBins)
+        for inst, drop, qdpH in (("BAT", dropCols, lcQDPH), ("BAT_NoEvolution", frozenset(), simpleQDPH)):
+            if inst not in data:
+                continue
+            instData = data[inst]
+            for b in instData["Binning"]:
+                binned = instData[b]
+                for d in binned["Datasets"]:
+                    fname = f"{destDir}/{prefix}{inst}_{b}_{d}{suff}"
+                    if not _skip(fname):
+                        tasks.append(batTasks(binned[d], fname, drop, qdpH, inst))
 
     if ("XRT" in data) and ("XRT" in instruments):
-        for m in ("WT", "PC"):
-            for s in ("", "_incbad"):
-                k = f"HRData_{m}{s}"
-                if k in data["XRT"]:
-                    qdpH = None
-                    if asQDP:
-                        qdpH = "READ TERR 1 2 3 4 5 6 7"
-
-                    cols = data["XRT"][k].columns.tolist()
-                    fname = f"{destDir}/{prefix}XRT_HR_{m}{s}{suff}"
-                    ok = dl._saveDFToDisk(
-                        data["XRT"][k],
-                        fname,
-                        cols,
-                        header,
-                        sep,
-                        qdpH,
-                        asQDP,
-                        clobber=clobber,
-                        silent=silent,
-                        verbose=verbose,
-                    )
-                    if not (ok or skipErrors):
-                        raise RuntimeError(f"Failed saving XRT {m}{s}-mode HR data to disk")
-
-        for d in data["XRT"]["Datasets"]:
+        xrt = data["XRT"]
+        for m, s in itertools.product(("WT", "PC"), ("", "_incbad")):
+            k = f"HRData_{m}{s}"
+            fname = f"{destDir}/{prefix}XRT_HR_{m}{s}{suff}"
+            if (k not in xrt) or _skip(fname):
+                continue
+            tmp = xrt[k]
+            tasks.append((tmp, fname, tmp.columns.tolist(), hrQDPH, f"XRT {m}{s}-mode HR"))
+
+        for d in xrt["Datasets"]:
             fname = f"{destDir}/{prefix}XRT_{d}{suff}"
-            qdpH = None
-            cols = data["XRT"][d].columns.tolist()
-            # For QDP, this gets more complicated, we need to filter the columns to get rid of the unwanted errors
-            if asQDP:
-                qdpH = "READ TERR 1 2 3 4"
-                removeStem = "WithECFErr"
-                if usePropagatedErrors:
-                    removeStem = ""
-                cols = [x for x in cols if (x != f"FluxPos{removeStem}") and (x != f"FluxNeg{removeStem}")]
-
-            ok = dl._saveDFToDisk(
-                data["XRT"][d], fname, cols, header, sep, qdpH, asQDP, clobber=clobber, silent=silent, verbose=verbose
-            )
-            if not (ok or skipErrors):
-                raise RuntimeError("Failed saving XRT data to disk")
+            if _skip(fname):
+                continue
+            tmp = xrt[d]
+            # dropCols is empty unless saving as QDP.
+            cols = [x for x in tmp.columns if x not in dropCols]
+            tasks.append((tmp, fname, cols, lcQDPH, "XRT"))
 
     if ("UVOT" in data) and ("UVOT" in instruments):
-        for d in data["UVOT"]["Datasets"]:
+        uvot = data["UVOT"]
+        for d in uvot["Datasets"]:
             fname = f"{destDir}/{prefix}UVOT_{d}{suff}"
-            qdpH = None
-            cols = data["UVOT"][d].columns.tolist()
-            if asQDP:
-                qdpH = "READ TERR 1 2"
+            if _skip(fname):
+                continue
+            tmp = uvot[d]
+            tasks.append((tmp, fname, tmp.columns.tolist(), simpleQDPH, "UVOT"))
+
+    # Each file is independent, so write several at once.
+    def _saveOne(task):
+        tmp, fname, cols, qdpH, what = task
+        ok = dl._saveDFToDisk(
+            tmp, fname, cols, header, sep, qdpH, asQDP, clobber=clobber, silent=silent, verbose=verbose
+        )
+        if not (ok or skipErrors):
+            raise RuntimeError(f"Failed saving {what} data to disk")
 
-            ok = dl._saveDFToDisk(
-                data["UVOT"][d], fname, cols, header, sep, qdpH, asQDP, clobber=clobber, silent=silent, verbose=verbose
-            )
-            if not (ok or skipErrors):
-                raise RuntimeError("Failed saving UVOTdata to disk")
+    base._runParallel(_saveOne, tasks, maxWorkers=maxWorkers)
 
 
 # --------------------------------------------------------------------
 # Data access
 
 
-def _getTargetsForGRB(targetID):
+def _getTargetsForGRB(targetID, useCache=False, cacheTTL=None):
     """Internal function to get all targets for a GRB.
 
     Parameters
@@ -1599,6 +2134,14 @@ def _getTargetsForGRB(targetID):
     targetID : str or int
         The GRB targetID
 
+    useCache : bool, optional
+        Whether to use the on-disk cache of API results (default:
+        ``False``).
+
+    cacheTTL : float, optional
+        The maximum age in seconds of a cached result that can be used
+        (default: ``None``, no limit).
+
     Returns
     -------
 
@@ -1608,15 +2151,20 @@ def _getTargetsForGRB(targetID):
     """
 
     sendData = {"targetID": targetID}
-    tmp = base.submitAPICall("getGRBTargetList", sendData, minKeys=("targetList",))
+    tmp = base._cachedAPICall(
+        "getGRBTargetList", sendData, useCache=useCache, cacheTTL=cacheTTL, minKeys=("targetList",)
+    )
     return tmp["targetList"]
 
 
+@base._verboseImpliesNotSilent
 def getObsData(
     targetID=None,
     GRBName=None,
     silent=True,
     verbose=False,
+    useCache=False,
+    cacheTTL=None,
     **kwargs,
 ):
     """Download the obsData associated with the GRB(s).
@@ -1640,27 +2188,43 @@ def getObsData(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    useCache : bool, optional
+        Whether to keep the list of targets for each GRB in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable
+        (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
     **kwargs: dict
         Arguments passed to ``ukssdc.data.downloadObsData()``.
 
     """
-    if verbose:
-        silent = False
-
     # Handle the arguments into a list, and whether we are getting a
     # single thing.
-    targetIDs, lookup, single = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
+    targetIDs, lookup, single, aliases = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
 
-    for t in targetIDs:
+    # Look up the targets for all of the GRBs at once, before starting the downloads.
+    targLists = base._runParallel(
+        lambda t: _getTargetsForGRB(t, useCache=useCache, cacheTTL=cacheTTL), targetIDs, maxWorkers=8
+    )
+
+    for t, targList in zip(targetIDs, targLists):
         if verbose:
             print(f"Getting {lookup[t]}")
-        targList = _getTargetsForGRB(t)
         if not silent:
             print(f"Have to get targetIDs: {targList}")
         dl.downloadObsDataByTarget(targList, silent=silent, verbose=verbose, **kwargs)
 
 
-def getPositions(targetID=None, GRBName=None, positions="all", silent=True, verbose=False):
+@base._verboseImpliesNotSilent
+def getPositions(
+    targetID=None, GRBName=None, positions="all", silent=True, verbose=False, useCache=False, cacheTTL=None
+):
     """Get the GRB position(s).
 
     This function returns the position(s) for a specified GRB or set
@@ -1685,6 +2249,18 @@ def getPositions(targetID=None, GRBName=None, positions="all", silent=True, verb
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    useCache : bool, optional
+        Whether to keep the positions downloaded from the server in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable
+        (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
     Returns
     -------
     dict
@@ -1692,10 +2268,7 @@ def getPositions(targetID=None, GRBName=None, positions="all", silent=True, verb
         above.
 
     """
-    if verbose:
-        silent = False
-
-    targetIDs, lookup, single = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
+    targetIDs, lookup, single, aliases = _handleGRBListArgument(targetID, GRBName, silent=silent, verbose=verbose)
 
     ret = {}
 
@@ -1717,8 +2290,9 @@ def getPositions(targetID=None, GRBName=None, positions="all", silent=True, verb
         # Now, first get the data:
         sendData["targetID"] = t
 
-        tmp = base.submitAPICall("getGRBPositions", sendData, verbose=verbose)
-        ret[key] = tmp
+        tmp = base._cachedAPICall("getGRBPositions", sendData, useCache=useCache, cacheTTL=cacheTTL, verbose=verbose)
+        for k in aliases[t]:
+            ret[k] = tmp
 
     if single:
         return ret[lookup[targetIDs[0]]]
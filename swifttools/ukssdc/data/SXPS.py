@@ -22,10 +22,12 @@ Provided functions:
 __docformat__ = "restructedtext en"
 
 
+import collections
+import gzip
 import os
+import shutil
 import pandas as pd
 import tempfile
-import subprocess
 from .. import main as base
 from . import download as dl
 
@@ -60,10 +62,26 @@ UL_FLOATCOLS = ("UpperLimit", "Rate", "RatePos", "RateNeg", "Counts", "BGCounts"
 
 BAND_NAMES = base.SXPS_BAND_NAMES
 
+# The images saveSourceImages() can retrieve for each source, in order.
+_IMAGE_NAMES = BAND_NAMES + ("Expmap",)
+
 tableLookup = {
     "extcatmatches": "xcorr",
 }
 
+# The boolean light curve options getLightCurves() accepts via kwargs.
+# The grouping options are ignored if getAllTypes is True.
+_LC_OPTIONS = ("showObs", "hideBadPup", "mergeAliases", "getAllTypes")
+_LC_GROUP_OPTIONS = ("groupRates", "groupULs", "groupHRss", "retroAsUL", "nondetAsUL", "getRetroHR")
+
+# Sources already found for transients, keyed on (cat, varName, str(ID)),
+# so that repeated calls for the same transients don't need to ask the
+# server again. Transients not yet in LSXPS are not cached, as they may
+# be added at any time. Only the most recently used _TRANS_CACHE_SIZE
+# entries are kept.
+_TRANS_CACHE_SIZE = 4096
+_transToSourceCache = collections.OrderedDict()
+
 # ----------------------------------------------------------------------
 # Source functions
 
@@ -89,8 +107,8 @@ def _handleSourceArgs(sourceID, sourceName):
     varName : str
         Either 'sourceID' or 'sourceName', the name of the argument to
             send to the API call.
-    varVal : list
-        A list of the sourceIDs/names supplied
+    varVal : list or tuple
+        The sourceIDs/names supplied, as a list or tuple
     single: bool
         Whether a single value, instead of a list, was supplied.
 
@@ -106,27 +124,14 @@ def _handleSourceArgs(sourceID, sourceName):
     if (sourceID is None) == (sourceName is None):
         raise ValueError("Exactly one of `sourceID` or `sourceName` must be set.")
 
-    varName = None
-    varVal = None
-    single = False
-
     if sourceName is not None:
-        varName = "sourceName"
-        if isinstance(sourceName, (list, tuple)):
-            varVal = sourceName
-        else:
-            varVal = [sourceName]
-            single = True
-
+        varName, val = "sourceName", sourceName
     else:
-        varName = "sourceID"
-        if isinstance(sourceID, (list, tuple)):
-            varVal = sourceID
-        else:
-            varVal = [sourceID]
-            single = True
+        varName, val = "sourceID", sourceID
 
-    return (varName, varVal, single)
+    if isinstance(val, (list, tuple)):
+        return (varName, val, False)
+    return (varName, (val,), True)
 
 
 def _transientToSource(cat, varName, varVal, skipErrors=False, silent=False, verbose=True):
@@ -168,22 +173,100 @@ def _transientToSource(cat, varName, varVal, skipErrors=False, silent=False, ver
     """
     if verbose:
         silent = False
-    tmpSend = {"whichCat": cat, varName: varVal}
-    tmp = base.submitAPICall("getSXPSTransAsSources", tmpSend, verbose=verbose, minKeys=("lookup",))
-    tmp2 = varVal
-    varVal = []
-    for k in tmp2:
-        k = str(k)
-        if (k not in tmp["lookup"]) or (tmp["lookup"][k] == "MISSING"):
+    # Only ask the server about transients we haven't already resolved.
+    found = {}
+    for k in map(str, varVal):
+        key = (cat, varName, k)
+        if key in _transToSourceCache:
+            _transToSourceCache.move_to_end(key)
+            found[k] = _transToSourceCache[key]
+
+    todo = [k for k in varVal if str(k) not in found]
+    if len(todo) > 0:
+        tmpSend = {"whichCat": cat, varName: todo}
+        tmp = base.submitAPICall("getSXPSTransAsSources", tmpSend, verbose=verbose, minKeys=("lookup",))
+        for k, v in tmp["lookup"].items():
+            if v != "MISSING":
+                found[str(k)] = v
+                _transToSourceCache[(cat, varName, str(k))] = v
+                if len(_transToSourceCache) > _TRANS_CACHE_SIZE:
+                    _transToSourceCache.popitem(last=False)
+
+    ret = []
+    for k in map(str, varVal):
+        v = found.get(k, "MISSING")
+        if v == "MISSING":
             if not silent:
                 print(f"Transient `{k}` is not yet in LSXPS.")
             if not skipErrors:
                 raise RuntimeError(f"Transient `{k}` is not yet in LSXPS.")
-        varVal.append(tmp["lookup"][k])
-    return varVal
+            continue
+        ret.append(v)
+    return ret
+
+
+def _selectSources(data, whichSources, what, silent=True):
+    """Internal function to get the sources to save from a data dict.
+
+    This checks that every requested source is in ``data`` (raising an
+    error listing any that are not, before anything is saved), removes
+    duplicates and skips sources that have been superseded by multiple
+    newer sources.
+
+    Parameters
+    ----------
+
+    data : dict
+        The ``dict`` of per-source data, as returned by a ``get``
+        function.
 
+    whichSources : list or str or None
+        The requested sources: keys of ``data``, or 'all' or ``None``
+        for all of them.
 
-def getSourceDetails(sourceID=None, sourceName=None, cat="LSXPS", silent=True, verbose=False, forceSingle=False):
+    what : str
+        What ``data`` contains, for the error message.
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    Returns
+    -------
+
+    list
+        The sources to save.
+
+    """
+    if (whichSources is None) or (whichSources == "all"):
+        whichSources = list(data.keys())
+    else:
+        whichSources = list(dict.fromkeys(whichSources))
+        missing = [s for s in whichSources if s not in data]
+        if len(missing) > 0:
+            raise ValueError(f"The following are not in the {what}: {missing}")
+
+    ret = []
+    for source in whichSources:
+        if "newerSources" in data[source]:
+            if not silent:
+                print(f"Skipping source {source} as is has been superseded by multiple sources.")
+        else:
+            ret.append(source)
+    return ret
+
+
+@base._verboseImpliesNotSilent
+def getSourceDetails(
+    sourceID=None,
+    sourceName=None,
+    cat="LSXPS",
+    silent=True,
+    verbose=False,
+    forceSingle=False,
+    maxWorkers=8,
+    useCache=False,
+    cacheTTL=None,
+):
     """Get the full set of information for an SXPS source.
 
     This obtains all of the information for a given SXPS source as
@@ -231,6 +314,22 @@ def getSourceDetails(sourceID=None, sourceName=None, cat="LSXPS", silent=True, v
     forceSingle : bool
         For internal usage. Top secret.
 
+    maxWorkers : int, optional
+        The maximum number of sources to get at once (default: 8).
+
+    useCache : bool, optional
+        Whether to keep the data downloaded from the server in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable. As
+        LSXPS is a dynamic catalogue, consider also setting
+        ``cacheTTL`` (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
     Returns
     -------
 
@@ -239,8 +338,6 @@ def getSourceDetails(sourceID=None, sourceName=None, cat="LSXPS", silent=True, v
         was supplied.
 
     """
-    if verbose:
-        silent = False  # noqa
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
 
     if forceSingle:
@@ -251,31 +348,35 @@ def getSourceDetails(sourceID=None, sourceName=None, cat="LSXPS", silent=True, v
     pdl1 = ("Detections", "NonDetections")
     pdl2 = ("Observations", "Stacks")
     # The argument has now been made into a list, so we can go through
-    # that list and submit the request to the API.
-    # We will store the results in ret
-    ret = {}
-
+    # that list and submit the request to the API. The calls are
+    # independent, so several are made at once.
     sendData = {"whichCat": cat}
-    for i in varVal:
+
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSSourceInfo", sendData, verbose=verbose)
+        tmp = base._cachedAPICall(
+            "getSXPSSourceInfo", dict(sendData, **{varName: i}), useCache=useCache, cacheTTL=cacheTTL, verbose=verbose
+        )
 
         if "data" in tmp:
-            ret[i] = tmp["data"]
-        else:
-            ret[i] = tmp
+            tmp = tmp["data"]
 
         for x in pdl1:
-            if x in ret[i]:
+            if x in tmp:
                 for y in pdl2:
-                    if y in ret[i][x]:
-                        ret[i][x][y] = pd.DataFrame(ret[i][x][y])
-        if "CrossMatch" in ret[i]:
-            ret[i]["CrossMatch"] = pd.DataFrame(ret[i]["CrossMatch"])
+                    if y in tmp[x]:
+                        tmp[x][y] = pd.DataFrame(tmp[x][y])
+        if "CrossMatch" in tmp:
+            tmp["CrossMatch"] = pd.DataFrame(tmp["CrossMatch"])
+        return tmp
+
+    # We will store the results in ret; each source is only fetched once,
+    # even if it was listed more than once.
+    uniq = list(dict.fromkeys(varVal))
+    ret = dict(zip(uniq, base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)))
 
     if single:
         return ret[varVal[0]]
@@ -283,6 +384,7 @@ def getSourceDetails(sourceID=None, sourceName=None, cat="LSXPS", silent=True, v
         return ret
 
 
+@base._verboseImpliesNotSilent
 def getLightCurves(
     sourceID=None,
     sourceName=None,
@@ -297,6 +399,9 @@ def getLightCurves(
     transient=False,
     transAsSource=False,
     skipErrors=False,
+    maxWorkers=8,
+    useCache=False,
+    cacheTTL=None,
     **kwargs,
 ):
     """Download a light curve, or set of light curves from SXPS.
@@ -389,6 +494,22 @@ def getLightCurves(
         Whether to continue if a transAsSource results in an error as
         above (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of sources to get at once (default: 8).
+
+    useCache : bool, optional
+        Whether to keep the data downloaded from the server in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable. As
+        LSXPS is a dynamic catalogue, consider also setting
+        ``cacheTTL`` (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
     silent : bool, optional
         Whether to suppress all output (default: ``True``).
 
@@ -522,9 +643,6 @@ def getLightCurves(
         bins.
 
     """
-    if verbose:
-        silent = False
-
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
 
     # Now handle the other arguments.
@@ -552,38 +670,22 @@ def getLightCurves(
         varVal = _transientToSource(cat, varName, varVal, skipErrors=skipErrors, silent=silent, verbose=verbose)
 
     # And there are other things that may have been set in kwargs.
-    # These are all bools. Start with the universal ones, and getAllTypes
+    # These are all bools: the universal ones and getAllTypes, and then
+    # the grouping and retrieval things, which getAllTypes overrides.
     if transAsSource or not transient:
-        tmp = ("showObs", "hideBadPup", "mergeAliases", "getAllTypes")
-        for t in tmp:
-            if t in kwargs.keys():
-                if not isinstance(kwargs[t], bool):
-                    raise RuntimeError(f"`{t}` should be boolean")
-                sendData[t] = kwargs[t]
-
-        # Now the grouping and retrieval things.
-        getAll = False
-        if "getAllTypes" in sendData:
-            getAll = sendData["getAllTypes"]
-
-        # Now handle all the grouping things
-        tmp = (
-            "groupRates",
-            "groupULs",
-            "groupHRss",
-            "retroAsUL",
-            "nondetAsUL",
-            "getRetroHR",
-        )
-        for t in tmp:
-            if t in kwargs:
-                if getAll:
-                    if not silent:
-                        print(f"WARNING: Ignoring parameter {t} as getAllTypes = True")
-                    continue
-                if not isinstance(kwargs[t], bool):
-                    raise RuntimeError(f"`{t}` should be boolean")
-                sendData[t] = kwargs[t]
+        opts = {t: kwargs[t] for t in _LC_OPTIONS if t in kwargs}
+        groupOpts = {t: kwargs[t] for t in _LC_GROUP_OPTIONS if t in kwargs}
+        if groupOpts and opts.get("getAllTypes", False):
+            if not silent:
+                for t in groupOpts:
+                    print(f"WARNING: Ignoring parameter {t} as getAllTypes = True")
+            groupOpts = {}
+        opts.update(groupOpts)
+
+        bad = [t for t, v in opts.items() if not isinstance(v, bool)]
+        if len(bad) > 0:
+            raise RuntimeError(f"`{bad[0]}` should be boolean")
+        sendData.update(opts)
 
     # If we had a list, then we will return a dict, where each API result
     # is an entry, and the supplied keys (IDs or names) are the dict keys.
@@ -593,24 +695,27 @@ def getLightCurves(
     # entry.
 
     binLookup = {"obslc": "Observation", "sslc": "Snapshot", "counts": "Counts"}
-    ret = {}
 
-    for i in varVal:
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
 
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSLC", sendData, verbose=verbose)
+        tmp = base._cachedAPICall(
+            "getSXPSLC", dict(sendData, **{varName: i}), useCache=useCache, cacheTTL=cacheTTL, verbose=verbose
+        )
 
         if tmp["Binning"] in binLookup:
             tmp["Binning"] = binLookup[tmp["Binning"]]
 
         if "Datasets" in tmp:
-            ret[i] = dl._handleLightCurve(tmp, silent, verbose)
-        else:
-            ret[i] = tmp
+            return dl._handleLightCurve(tmp, silent=silent, verbose=verbose)
+        return tmp
+
+    # The API calls are independent, so make several at once.
+    uniq = list(dict.fromkeys(varVal))
+    ret = dict(zip(uniq, base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)))
 
     if saveData:
         d = ret
@@ -662,7 +767,10 @@ def saveLightCurves(
         otherwise all have the same names (default: ``True``).
 
     **kwargs : dict, optional
-        Other arguments to pass to _saveLightCurveFromDict()
+        Other arguments to pass to _saveLightCurveFromDict(), such as
+        ``format='parquet'`` to save Parquet rather than text files.
+        You can also set ``maxWorkers``, the maximum number of sources
+        to save at once (default: the number of CPUs).
 
 
     """
@@ -691,9 +799,8 @@ def saveLightCurves(
 
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # Which sources am I saving?
-    if (whichSources is None) or (whichSources == "all"):
-        whichSources = data.keys()
+    # Which sources am I saving? Check they all exist before saving any.
+    whichSources = _selectSources(data, whichSources, "light curve list", silent=silent)
 
     # For SXPS objects we add the time or binning to the extension unless the user says no
     if "timeFormatInFname" not in kwargs:
@@ -703,27 +810,34 @@ def saveLightCurves(
 
     # prefix should not be in this dict, so remove if it is.
     kwargs.pop("prefix", None)
+    maxWorkers = kwargs.pop("maxWorkers", os.cpu_count())
 
-    # Now start saving light curves, one source at a time
+    # Work out where each source goes.
+    jobs = []
     for source in whichSources:
-        if source not in data:
-            raise ValueError(f"{source} is not in the light curve list.")
-
-        if "newerSources" in data[source]:
-            if not silent:
-                print(f"Skipping source {source} as is has been superseded by multiple sources.")
-            continue
-
         path = destDir
         prefix = ""
         if subDirs:
             path = f"{destDir}/{source}"
         elif usePrefix:
             prefix = f"{source}_"
+        jobs.append((source, path, prefix))
+
+    # Create the directories here, once each, rather than in the
+    # (parallel) save calls.
+    if subDirs:
+        for job in jobs:
+            base._createDir(job[1], silent=silent, verbose=verbose)
 
+    # Now save the light curves; this is all disk I/O so we can do several sources at once.
+    def _saveOne(job):
+        source, path, prefix = job
         dl._saveLightCurveFromDict(data[source], destDir=path, prefix=prefix, **kwargs)
 
+    base._runParallel(_saveOne, jobs, maxWorkers=maxWorkers)
 
+
+@base._verboseImpliesNotSilent
 def getSpectra(
     sourceID=None,
     sourceName=None,
@@ -736,6 +850,9 @@ def getSpectra(
     skipErrors=False,
     silent=True,
     verbose=False,
+    maxWorkers=8,
+    useCache=False,
+    cacheTTL=None,
     **kwargs,
 ):
     """Download a spectrum, or set of spectra from SXPS.
@@ -824,6 +941,22 @@ def getSpectra(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of sources to get at once (default: 8).
+
+    useCache : bool, optional
+        Whether to keep the data downloaded from the server in an
+        on-disk cache, and reuse them for identical requests. The cache
+        is kept in ``~/.cache/swifttools/ukssdc``, or the directory
+        given by the ``SWIFTTOOLS_CACHE_DIR`` environment variable. As
+        LSXPS is a dynamic catalogue, consider also setting
+        ``cacheTTL`` (default: ``False``).
+
+    cacheTTL : float, optional
+        If ``useCache`` is ``True``, the maximum age in seconds of
+        cached data that can be used, or ``None`` for no limit
+        (default: ``None``).
+
     **kwargs : dict, optional
         Any arguments to pass to ``saveSpectra()``
 
@@ -835,9 +968,6 @@ def getSpectra(
         An API-standard spectrum dict.
 
     """
-    if verbose:
-        silent = False
-
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
 
     # Now handle the other arguments.
@@ -858,15 +988,19 @@ def getSpectra(
             else:
                 sendData["specType"] = specType
 
-    ret = {}
-    for i in varVal:
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
 
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        ret[i] = base.submitAPICall("getSXPSSpectrumData", sendData, verbose=verbose)
+        return base._cachedAPICall(
+            "getSXPSSpectrumData", dict(sendData, **{varName: i}), useCache=useCache, cacheTTL=cacheTTL, verbose=verbose
+        )
+
+    # The API calls are independent, so make several at once.
+    uniq = list(dict.fromkeys(varVal))
+    ret = dict(zip(uniq, base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)))
 
     if saveData:
         saveAsTrans = transient and not transAsSource and specType.lower() == "both"
@@ -882,6 +1016,7 @@ def getSpectra(
             return ret
 
 
+@base._verboseImpliesNotSilent
 def saveSpectra(data, destDir="spec", whichSources=None, transient=False, silent=True, verbose=False, **kwargs):
     """Save the spectral data to disk.
 
@@ -911,11 +1046,12 @@ def saveSpectra(data, destDir="spec", whichSources=None, transient=False, silent
         Whether to write verbose output (default: ``False``).
 
     **kwargs : dict, optional
-        Arguments to pass to ``download.dl._saveSpectrum()``
+        Arguments to pass to ``download.dl._saveSpectrum()``. You can
+        also set ``maxWorkers``, the maximum number of spectra to save
+        at once (default: the number of CPUs).
 
     """
-    if verbose:
-        silent = False
+    maxWorkers = kwargs.pop("maxWorkers", os.cpu_count())
 
     # Little hack needed here to handle the case that we have only a single spectrum, not a dict of LCs
     # We will know this because it will have the 'Datasets' key
@@ -928,30 +1064,24 @@ def saveSpectra(data, destDir="spec", whichSources=None, transient=False, silent
     # Create the output dir, if needed.
     base._createDir(destDir, silent=silent, verbose=verbose)
 
-    # Which sources am I saving?
-    if (whichSources is None) or (whichSources == "all"):
-        whichSources = data.keys()
-
-    # Now start saving spectra, one source at a time
-    for source in whichSources:
-        if source not in data:
-            raise ValueError(f"{source} is not in the spectra available.")
-        if "NoSpectrum" in data[source]:
-            if not silent:
+    # Which sources am I saving? Check they all exist before saving any,
+    # and drop those without spectra.
+    whichSources = _selectSources(data, whichSources, "spectra available", silent=silent)
+    if not silent:
+        for source in whichSources:
+            if "NoSpectrum" in data[source]:
                 print(f"Source `{source}` has no spectra.")
-            continue
-
-        if "newerSources" in data[source]:
-            if not silent:
-                print(f"Skipping source {source} as is has been superseded by multiple sources.")
-            continue
+    whichSources = [s for s in whichSources if "NoSpectrum" not in data[s]]
 
+    # Work out where each spectrum goes, then download them several at a
+    # time.
+    jobs = []
+    for source in whichSources:
         path = destDir
         if not single:
             path = f"{destDir}/{source}"
             base._createDir(path, silent=silent, verbose=verbose)
 
-        print(f"Transient {transient}")
         if transient:
             for i in ("Full", "Discovery"):
                 if i in data[source]:
@@ -962,11 +1092,18 @@ def saveSpectra(data, destDir="spec", whichSources=None, transient=False, silent
                     else:
                         fpath = f"{path}/{i}"
                         base._createDir(fpath, silent=silent, verbose=verbose)
-                        dl._saveSpectrum(data[source][i], destDir=fpath, silent=silent, verbose=verbose, **kwargs)
+                        jobs.append((data[source][i], fpath))
         else:
-            dl._saveSpectrum(data[source], destDir=path, silent=silent, verbose=verbose, **kwargs)
+            jobs.append((data[source], path))
 
+    def _saveOne(job):
+        spec, path = job
+        dl._saveSpectrum(spec, destDir=path, silent=silent, verbose=verbose, **kwargs)
 
+    base._runParallel(_saveOne, jobs, maxWorkers=maxWorkers)
+
+
+@base._verboseImpliesNotSilent
 def saveSourceImages(
     sourceID=None,
     sourceName=None,
@@ -980,6 +1117,7 @@ def saveSourceImages(
     transAsSource=False,
     silent=True,
     verbose=False,
+    maxWorkers=8,
 ):
     """Download the thumbnail images of the sources.
 
@@ -1043,10 +1181,11 @@ def saveSourceImages(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
-    """
-    if verbose:
-        silent = False
+    maxWorkers : int, optional
+        The maximum number of API calls or downloads to make at once
+        (default: 8).
 
+    """
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
 
     sendData = {"whichCat": cat, "bands": bands}
@@ -1060,15 +1199,22 @@ def saveSourceImages(
 
     # Create the output dir, if needed.
     base._createDir(destDir, silent=silent, verbose=verbose)
-    for i in varVal:
+
+    # Get the image URLs for all of the sources, several at once.
+    def _getOne(i):
         if verbose:
             print(f"Getting images for {varName} = `{i}`")
-        sendData[varName] = i
 
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSSourceImages", sendData, verbose=verbose)
+        return base.submitAPICall("getSXPSSourceImages", dict(sendData, **{varName: i}), verbose=verbose)
+
+    uniq = list(dict.fromkeys(varVal))
+    results = base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)
 
+    # Now build the list of images to save, making the directories as we go.
+    jobs = []
+    for i, tmp in zip(uniq, results):
         path = destDir
         prefix = None
         if subDirs:
@@ -1076,51 +1222,42 @@ def saveSourceImages(
             base._createDir(path, silent=silent, verbose=verbose)
         else:
             prefix = f"{i}_"
-        for b in BAND_NAMES:
-            if b in tmp:
-                url = tmp[b]
-                if (url == "NOTFOUND") and (not silent):
-                    print(f"No image exists for the {b} band for `{i}`.")
+        images = {b: tmp[b] for b in _IMAGE_NAMES if b in tmp}
+        for b, url in images.items():
+            if url != "NOTFOUND":
+                jobs.append((url, path, f"{b}.png", prefix))
+            elif not silent:
+                if b == "Expmap":
+                    print(f"No exposure map image exists for `{i}`.")
                 else:
-                    ok = dl._saveURLToFile(
-                        url,
-                        path,
-                        name=f"{b}.png",
-                        prefix=prefix,
-                        clobber=clobber,
-                        silent=silent,
-                        verbose=verbose,
-                    )
-                    if not ok:
-                        if skipErrors:
-                            continue
-                        raise RuntimeError(f"Failed to save {url} to {path}/")
-        if "Expmap" in tmp:
-            url = tmp["Expmap"]
-            if (url == "NOTFOUND") and (not silent):
-                print(f"No exposure map image exists for `{i}`.")
-            else:
-                ok = dl._saveURLToFile(
-                    url,
-                    path,
-                    name="Expmap.png",
-                    prefix=prefix,
-                    clobber=clobber,
-                    silent=silent,
-                    verbose=verbose,
-                )
-                if not ok:
-                    if skipErrors:
-                        continue
-                    raise RuntimeError(f"Failed to save {url} to {path}/")
+                    print(f"No image exists for the {b} band for `{i}`.")
+
+    # And download them, several at once.
+    def _saveOne(job):
+        url, path, name, prefix = job
+        return dl._saveURLToFile(url, path, name=name, prefix=prefix, clobber=clobber, silent=silent, verbose=verbose)
+
+    results = base._runParallel(_saveOne, jobs, maxWorkers=maxWorkers)
+
+    for (url, path, _, _), ok in zip(jobs, results):
+        if not (ok or skipErrors):
+            raise RuntimeError(f"Failed to save {url} to {path}/")
 
 
 # ----------------------------------------------------------------------
 # Transient functions
 
 
+@base._verboseImpliesNotSilent
 def getTransientDetails(
-    sourceID=None, sourceName=None, cat="LSXPS", transAsSource=False, skipErrors=False, silent=True, verbose=False
+    sourceID=None,
+    sourceName=None,
+    cat="LSXPS",
+    transAsSource=False,
+    skipErrors=False,
+    silent=True,
+    verbose=False,
+    maxWorkers=8,
 ):
     """Get the full set of information for an SXPS transient.
 
@@ -1160,6 +1297,9 @@ def getTransientDetails(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of API calls to make at once (default: 8).
+
     Returns
     -------
 
@@ -1168,26 +1308,31 @@ def getTransientDetails(
         was supplied.
 
     """
-    if verbose:
-        silent = False
-
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
     if transAsSource:
         varVal = _transientToSource(cat, varName, varVal, skipErrors=skipErrors, silent=silent, verbose=verbose)
-        args = {varName: varVal, "cat": cat, "silent": silent, "verbose": verbose, "forceSingle": single}
+        args = {
+            varName: varVal,
+            "cat": cat,
+            "silent": silent,
+            "verbose": verbose,
+            "forceSingle": single,
+            "maxWorkers": maxWorkers,
+        }
         return getSourceDetails(**args)
 
-    ret = {}
-
     sendData = {"whichCat": cat}
-    for i in varVal:
+
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSTransInfo", sendData, verbose=verbose)
-        ret[i] = tmp
+        return base.submitAPICall("getSXPSTransInfo", dict(sendData, **{varName: i}), verbose=verbose)
+
+    # The API calls are independent, so make several at once.
+    uniq = list(dict.fromkeys(varVal))
+    ret = dict(zip(uniq, base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)))
 
     if single:
         return ret[varVal[0]]
@@ -1199,6 +1344,7 @@ def getTransientDetails(
 # Upper limit functions
 
 
+@base._verboseImpliesNotSilent
 def getUpperLimits(
     position=None,
     name=None,
@@ -1373,9 +1519,6 @@ def getUpperLimits(
             hence count-rate values) may be wrong.
 
     """
-    if verbose:
-        silent = False
-
     # Handle the arguments. Do not need to sanity check all arguments,
     # as this can be done by the back end and it makes sense to do it
     # just once, but we do need to handle a few things. First, put most
@@ -1438,6 +1581,7 @@ def getUpperLimits(
     return tmp
 
 
+@base._verboseImpliesNotSilent
 def getFailedUpperLimit(id, pandas=True, silent=True, verbose=False):
     """Try to get an upper limit that timed out.
 
@@ -1484,9 +1628,6 @@ def getFailedUpperLimit(id, pandas=True, silent=True, verbose=False):
         Whether to write verbose output (default ``False``)..
 
     """
-    if verbose:
-        silent = False
-
     if not isinstance(id, str):
         raise ValueError("`id` must be a string.")
 
@@ -1509,19 +1650,14 @@ def _handleUL(data):
     """Internal function to convert UL data to pandas"""
 
     if "ULData" in data:
-        data["ULData"] = pd.DataFrame(data["ULData"], columns=data["Columns"])
-        for c in ("SourceExposure", "ImageExposure"):
-            if c in data["Columns"]:
-                data["ULData"][c] = data["ULData"][c].apply(lambda x: float(x))
+        # Work out the type of each column we need to convert, then cast
+        # them all in one go as the DataFrame is built.
+        cols = set(data["Columns"])
+        dtypes = {c: float for c in ("SourceExposure", "ImageExposure") if c in cols}
         for b in BAND_NAMES:
-            for col in UL_BOOLCOLS:
-                c = f"{b}_{col}"
-                if c in data["Columns"]:
-                    data["ULData"][c] = data["ULData"][c].apply(lambda x: bool(x))
-            for col in UL_FLOATCOLS:
-                c = f"{b}_{col}"
-                if c in data["Columns"]:
-                    data["ULData"][c] = data["ULData"][c].apply(lambda x: float(x))
+            dtypes.update({f"{b}_{col}": bool for col in UL_BOOLCOLS if f"{b}_{col}" in cols})
+            dtypes.update({f"{b}_{col}": float for col in UL_FLOATCOLS if f"{b}_{col}" in cols})
+        data["ULData"] = pd.DataFrame(data["ULData"], columns=data["Columns"]).astype(dtypes, copy=False)
 
     if "DetData" in data:
         data["DetData"] = pd.DataFrame(data["DetData"])
@@ -1584,7 +1720,8 @@ def _handleDSArgs(DatasetID, ObsID):
     return (varName, varVal, single)
 
 
-def getDatasetDetails(DatasetID=None, ObsID=None, cat="LSXPS", silent=True, verbose=False):
+@base._verboseImpliesNotSilent
+def getDatasetDetails(DatasetID=None, ObsID=None, cat="LSXPS", silent=True, verbose=False, maxWorkers=8):
     """Get the full set of information for an SXPS dataset.
 
     This obtains all of the information for a given SXPS dataset as
@@ -1621,6 +1758,9 @@ def getDatasetDetails(DatasetID=None, ObsID=None, cat="LSXPS", silent=True, verb
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of API calls to make at once (default: 8).
+
     Returns
     -------
 
@@ -1629,24 +1769,25 @@ def getDatasetDetails(DatasetID=None, ObsID=None, cat="LSXPS", silent=True, verb
         was supplied.
 
     """
-    if verbose:
-        silent = False  # noqa
-
     varName, varVal, single = _handleDSArgs(DatasetID, ObsID)
 
     # The argument has now been made into a list, so we can go through
-    # that list and submit the request to the API.
-    # We will store the results in ret
-    ret = {}
-
+    # that list and submit the request to the API, several at once.
     sendData = {"whichCat": cat}
-    for i in varVal:
+
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSDatasetInfo", sendData, verbose=verbose)
+        return base.submitAPICall("getSXPSDatasetInfo", dict(sendData, **{varName: i}), verbose=verbose)
+
+    uniq = list(dict.fromkeys(varVal))
+    results = base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)
+
+    # We will store the results in ret
+    ret = {}
+    for i, tmp in zip(uniq, results):
         j = i
         if varName == "ObsID":
             if not single and isinstance(i, int):
@@ -1671,6 +1812,7 @@ def getDatasetDetails(DatasetID=None, ObsID=None, cat="LSXPS", silent=True, verb
         return ret
 
 
+@base._verboseImpliesNotSilent
 def saveDatasetImages(
     DatasetID=None,
     ObsID=None,
@@ -1684,6 +1826,7 @@ def saveDatasetImages(
     skipErrors=False,
     silent=True,
     verbose=False,
+    maxWorkers=8,
 ):
     """Get the full set of information for an SXPS dataset.
 
@@ -1742,6 +1885,10 @@ def saveDatasetImages(
     verbose : bool, optional
         Whether to write verbose output (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of API calls or downloads to make at once
+        (default: 8).
+
     Returns
     -------
 
@@ -1750,9 +1897,6 @@ def saveDatasetImages(
         was supplied.
 
     """
-    if verbose:
-        silent = False
-
     varName, varVal, single = _handleDSArgs(DatasetID, ObsID)
 
     # The argument has now been made into a list, so we can go through
@@ -1763,13 +1907,20 @@ def saveDatasetImages(
 
     sendData = {"whichCat": cat, "bands": bands, "types": types, "getRegions": getRegions}
 
-    for i in varVal:
+    # Get the image URLs for all of the datasets, several at once.
+    def _getOne(i):
         if verbose:
             print(f"Getting data for {varName} = `{i}`")
-        sendData[varName] = i
         # We can just accept this result, as the only key we have to have is "OK", and
         # if that wasn't set we will already have hit an error.
-        tmp = base.submitAPICall("getSXPSDatasetImages", sendData, verbose=verbose)
+        return base.submitAPICall("getSXPSDatasetImages", dict(sendData, **{varName: i}), verbose=verbose)
+
+    uniq = list(dict.fromkeys(varVal))
+    results = base._runParallel(_getOne, uniq, maxWorkers=maxWorkers)
+
+    # Now build the list of files to save, making the directories as we go.
+    jobs = []
+    for i, tmp in zip(uniq, results):
         if "SupersededBy" in tmp:
             print("\n ** WARNING: This dataset is an obsolete stack ** \n")
         path = destDir
@@ -1782,32 +1933,42 @@ def saveDatasetImages(
 
         for b in BAND_NAMES:
             if b in tmp:
-                for t in tmp[b]:
-                    url = tmp[b][t]
-                    if (url == "NOTFOUND") and (not silent):
+                for t, url in tmp[b].items():
+                    if url != "NOTFOUND":
+                        jobs.append((url, path))
+                    elif not silent:
                         print(f"No {t} image exists for the {b} band for `{i}`.")
-                    else:
-                        ok = dl._saveURLToFile(url, path, clobber=clobber, silent=silent, verbose=verbose)
-                        if not ok:
-                            if skipErrors:
-                                continue
-                            raise RuntimeError(f"Failed to save {url} to {path}/")
         if "Expmap" in tmp:
             url = tmp["Expmap"]
-            if (url == "NOTFOUND") and (not silent):
+            if url != "NOTFOUND":
+                jobs.append((url, path))
+            elif not silent:
                 print(f"No exposure map image exists for `{i}`.")
-            else:
-                ok = dl._saveURLToFile(url, path, clobber=clobber, silent=silent, verbose=verbose)
-                if not ok:
-                    if skipErrors:
-                        continue
-                    raise RuntimeError(f"Failed to save {url} to {path}/")
+
+    # And download them, several at once, over the shared session. Files
+    # are named from their URLs, so without subDirs two datasets could
+    # share a destination; keep any such downloads on the same thread, in
+    # order, so they can't write the same file at once.
+    groups = {}
+    for url, path in jobs:
+        groups.setdefault(f"{path}/{os.path.basename(url)}", []).append((url, path))
+
+    def _saveGroup(group):
+        return [dl._saveURLToFile(url, path, clobber=clobber, silent=silent, verbose=verbose) for url, path in group]
+
+    results = base._runParallel(_saveGroup, list(groups.values()), maxWorkers=maxWorkers)
+
+    for group, oks in zip(groups.values(), results):
+        for (url, path), ok in zip(group, oks):
+            if not (ok or skipErrors):
+                raise RuntimeError(f"Failed to save {url} to {path}/")
 
 
 # ----------------------------------------------------------------------
 # Catalogue table functions
 
 
+@base._verboseImpliesNotSilent
 def listOldTables(silent=True, verbose=False):
     """Get the list of old tables.
 
@@ -1833,13 +1994,12 @@ def listOldTables(silent=True, verbose=False):
         snapshots.
 
     """
-    if verbose:
-        silent = False  # noqa
     sendData = {}
     tmp = base.submitAPICall("getOldSXPSTables", sendData, verbose=verbose, minKeys=("hourly", "daily"))
     return tmp
 
 
+@base._verboseImpliesNotSilent
 def getFullTable(
     cat="LSXPS",
     table=None,
@@ -1912,9 +2072,6 @@ def getFullTable(
         data.
 
     """
-    if verbose:
-        silent = False
-
     if (table is None) or not isinstance(table, str):
         raise RuntimeError("`table` is a required parameter and must be a string")
 
@@ -1965,12 +2122,14 @@ def getFullTable(
 
     # Do we need to unzip it?
     if fname[-3:] == ".gz":
-        comm = ["gunzip", fname]
         if verbose:
             print(f"gunzipping {fname}")
-        status = subprocess.run(comm, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if status.returncode != 0:
-            raise RuntimeError(f"Could not gunzip the downloaded file {fname}")
+        try:
+            with gzip.open(fname, "rb") as fin, open(fname[:-3], "wb") as fout:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+        except (OSError, EOFError) as e:
+            raise RuntimeError(f"Could not gunzip the downloaded file {fname}: {e}")
+        os.remove(fname)
         fname = fname[:-3]
 
     ret = None
@@ -1992,6 +2151,7 @@ def getFullTable(
 # xrt_prods functions
 
 
+@base._verboseImpliesNotSilent
 def makeProductRequest(
     email,
     sourceID=None,
@@ -2129,9 +2289,6 @@ def makeProductRequest(
         Whether to write verbose output (default: ``False``).
 
     """
-    if verbose:
-        silent = False
-
     # First, handle sourceName or sourceID.
     varName, varVal, single = _handleSourceArgs(sourceID, sourceName)
 
@@ -2340,14 +2497,12 @@ def _makeSingleProductRequest(
     return req
 
 
+@base._verboseImpliesNotSilent
 def getObsList(
     sourceDetails=None, sourceID=None, sourceName=None, cat="LSXPS", useObs=None, silent=True, verbose=False
 ):
     """Get the list of catalogue observations covering the source"""
 
-    if verbose:
-        silent = False
-
     if sourceDetails is None:
         sourceDetails = getSourceDetails(
             sourceID=sourceID, sourceName=sourceName, cat=cat, silent=silent, verbose=verbose
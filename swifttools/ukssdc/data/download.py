@@ -14,21 +14,32 @@ import shutil
 import requests
 import re
 import fnmatch
+import numpy as np
 import pandas as pd
+import random
 import subprocess
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .. import main as base
 
 
 _allowedInstruments = ["bat", "xrt", "uvot"]
 _allowedSources = ["uk", "uk_reproc", "us", "italy"]
 
+# Size of the blocks in which files are streamed to disk; workers check
+# for cancellation between blocks.
+_CHUNK_SIZE = 1 << 20
+
 try:
     from tqdm.auto import tqdm
 except ImportError:
 
     def tqdm(*args, **kwargs):
         """A real simple replacement for tqdm if it's not locally installed"""
-        print(f"Downloading {len(args[0])} files...")
+        n = kwargs["total"] if "total" in kwargs else len(args[0])
+        print(f"Downloading {n} files...")
         return args[0]
 
 
@@ -44,6 +55,7 @@ def downloadObsData(
     reMatch=None,
     clobber=False,
     skipErrors=False,
+    maxWorkers=4,
     silent=True,
     verbose=False,
     **kwargs,
@@ -103,6 +115,10 @@ def downloadObsData(
         Whether to continue to the next file/observation if an error is
         encountered (default: ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of files to download simultaneously
+        (default: 4).
+
     silent : bool, optional
         Whether to suppress all output (default: ``True``).
 
@@ -237,20 +253,10 @@ def downloadObsData(
             outDirName = f"{obsPath}/{dir}"
             base._createDir(outDirName, silent=silent, verbose=verbose)
 
-        # Now get the files, use tqdm to plot progress:
-        # display = not silent
+        # Now work out which files we want.
         urlBase = fileData["url"]
-
-        if silent:
-            myList = fileTree["files"]
-        else:
-            myList = tqdm(fileTree["files"], desc=f"Downloading {obs}", unit="files")
-
-        # for f in tqdm(fileTree["files"], desc=f"Downloading {obs}", unit="files", display=display):
-        for f in myList:
-            url = f"{urlBase}/{f}"
-            outPath = f"{obsPath}/{f}"
-
+        jobs = []
+        for f in fileTree["files"]:
             if match is not None:
                 isOK = False
                 for m in match:
@@ -272,16 +278,9 @@ def downloadObsData(
                         print(f"Skipping file {f}")
                     continue
 
-            r = requests.get(url, stream=True, allow_redirects=True)
-            if r.ok:
-                filedata = r.raw.read()
-                with open(outPath, "wb") as outfile:
-                    outfile.write(filedata)
-            else:
-                if not skipErrors:
-                    raise RuntimeError(f"Failed to download {url}")
-                if not silent:
-                    print(f"Failed to download {url}")
+            jobs.append((f"{urlBase}/{f}", f"{obsPath}/{f}"))
+
+        _fetchMany(jobs, desc=f"Downloading {obs}", maxWorkers=maxWorkers, skipErrors=skipErrors, silent=silent)
 
 
 def downloadObsDataByTarget(targetID, silent=True, verbose=False, **kwargs):
@@ -358,6 +357,112 @@ def _getObsList(targetID, silent=True, verbose=False):
 # internally.
 
 
+def _fetchOne(url, outPath, cancel):
+    """Internal function to download a single file to disk.
+
+    The file is streamed to disk in chunks; if ``cancel`` is set
+    between chunks the download is abandoned, the connection closed
+    and the partial file removed.
+
+    Parameters
+    ----------
+
+    url : str
+        The URL of the file to download.
+
+    outPath : str
+        The path to save the file to.
+
+    cancel : threading.Event
+        An event which, if set, indicates the download should stop.
+
+    Returns
+    -------
+
+    tuple
+        (url, bool) The URL and whether the file was downloaded.
+
+    """
+    if cancel.is_set():
+        return (url, False)
+
+    r = base._session.get(url, stream=True, allow_redirects=True)
+    if not r.ok:
+        r.close()
+        return (url, False)
+
+    try:
+        with open(outPath, "wb") as outfile:
+            for chunk in r.raw.stream(_CHUNK_SIZE, decode_content=False):
+                if cancel.is_set():
+                    break
+                outfile.write(chunk)
+    finally:
+        r.close()
+
+    if cancel.is_set():
+        os.unlink(outPath)
+        return (url, False)
+    return (url, True)
+
+
+def _fetchMany(jobs, desc="Downloading", maxWorkers=4, skipErrors=False, silent=True):
+    """Internal function to download a set of files in parallel.
+
+    The files are downloaded by a pool of threads. If a download fails
+    (and ``skipErrors`` is ``False``), or the user interrupts the
+    download, all other downloads are cancelled rather than being left
+    to run to completion.
+
+    Parameters
+    ----------
+
+    jobs : list
+        A list of (url, outPath) tuples to download.
+
+    desc : str, optional
+        The description to give the progress bar.
+
+    maxWorkers : int, optional
+        The maximum number of files to download simultaneously
+        (default: 4).
+
+    skipErrors : bool, optional
+        Whether to continue if a file cannot be downloaded
+        (default: ``False``).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    """
+    if len(jobs) == 0:
+        return
+
+    cancel = threading.Event()
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        futures = [executor.submit(_fetchOne, url, outPath, cancel) for url, outPath in jobs]
+        try:
+            if silent:
+                myList = as_completed(futures)
+            else:
+                myList = tqdm(as_completed(futures), desc=desc, unit="files", total=len(futures))
+
+            for fut in myList:
+                url, ok = fut.result()
+                if not ok:
+                    if not skipErrors:
+                        raise RuntimeError(f"Failed to download {url}")
+                    if not silent:
+                        print(f"Failed to download {url}")
+        except BaseException:
+            # Covers KeyboardInterrupt as well as errors: stop the
+            # running downloads and drop the queued ones.
+            cancel.set()
+            for fut in futures:
+                fut.cancel()
+            raise
+
+
 def _saveURLToFile(url, path, prefix=None, name=None, clobber=False, silent=True, verbose=False):
     """Internal function to download and save a file.
 
@@ -403,19 +508,20 @@ def _saveURLToFile(url, path, prefix=None, name=None, clobber=False, silent=True
     if verbose:
         print(f"Downloading file `{fname}`")
 
-    # # TEMP LINES
-    # from requests.auth import HTTPBasicAuth
+    # Stream the file to disk in blocks, so that large files (e.g. tar
+    # files) are never held in memory in full.
+    d = base._session.get(url, stream=True)
+    try:
+        if verbose:
+            print(f"Saving file `{fname}`")
 
-    d = requests.get(
-        url,
-        # auth=HTTPBasicAuth("LSXPS", "CatPreview"),
-    )
-    if verbose:
-        print(f"Saving file `{fname}`")
+        with open(fname, "wb") as f:
+            for block in d.iter_content(chunk_size=_CHUNK_SIZE):
+                f.write(block)
+    finally:
+        d.close()
 
-    with open(fname, "wb") as f:
-        f.write(d.content)
-        return True
+    return True
 
 
 def _getFileList(obs, dirs, source, silent=True, verbose=False):
@@ -458,7 +564,58 @@ def _getFileList(obs, dirs, source, silent=True, verbose=False):
     return ret
 
 
-def _handleLightCurve(data, oldCols=False, silent=True, verbose=False):
+def _lcDataFrame(rows, cols):
+    """Internal function to build a light curve DataFrame.
+
+    All columns are floats, except for ObsID and URL which are strings.
+    Where possible the rows are converted into a single numpy array and
+    each column is converted from that in one go; if that fails (e.g.
+    the rows are ragged, or contain something numpy cannot convert) the
+    slower, but more forgiving, pandas conversion is used instead.
+
+    Parameters
+    ----------
+
+    rows : list
+        The rows of data, as decoded from JSON.
+
+    cols : list
+        The column names.
+
+    Returns
+    -------
+
+    DataFrame
+        The light curve data.
+
+    """
+    strCols = ("ObsID", "URL")
+
+    if len(set(cols)) == len(cols):
+        try:
+            arr = np.array(rows, dtype=object).reshape(-1, len(cols))
+            byCol = {}
+            for i, c in enumerate(cols):
+                if c in strCols:
+                    byCol[c] = pd.Series(arr[:, i], dtype=str)
+                else:
+                    byCol[c] = arr[:, i].astype(np.float64)
+            return pd.DataFrame(byCol, columns=cols)
+        except (ValueError, TypeError):
+            pass
+
+    types = {}
+    for c in cols:
+        if c in strCols:
+            types[c] = str
+        else:
+            types[c] = float
+
+    tmpDF = pd.DataFrame(rows, columns=cols, dtype=str)
+    return tmpDF.astype(types)
+
+
+def _handleLightCurve(data, oldCols=False, silent=True, verbose=False, *, boolCols=()):
     """Convert light curves returned via API into pandas DataFrames.
 
     This is a generic function which receives light curves returned by
@@ -481,6 +638,10 @@ def _handleLightCurve(data, oldCols=False, silent=True, verbose=False):
     verbose : bool, optional
         Whether to write lots of output (default: ``False``).
 
+    boolCols : tuple, optional
+        Keyword only. Columns which hold 0/1 flags, and should be
+        converted to booleans (default: ``()``).
+
     Returns
     -------
     pandas.DataFrame
@@ -512,16 +673,12 @@ def _handleLightCurve(data, oldCols=False, silent=True, verbose=False):
         if "UL" in key and not oldCols:
             cols = ["UpperLimit" if x == "Rate" else x for x in cols]
 
-        tmpDF = pd.DataFrame(data[tmpKey]["data"], columns=cols, dtype=str)
-
-        types = {}
-        for c in cols:
-            if c in ("ObsID", "URL"):
-                types[c] = str
-            else:
-                types[c] = float
-
-        ret[key] = tmpDF.astype(types)
+        ret[key] = _lcDataFrame(data[tmpKey]["data"], cols)
+        # The flags have to be parsed as numbers first, as any non-empty
+        # string (including "0") would be True.
+        for c in boolCols:
+            if c in ret[key].columns:
+                ret[key][c] = ret[key][c].to_numpy() != 0
         # -- OPTION - could remove the RatePos and RateNeg columns if "UL" in tmpKey
 
         if "ObsID" in ret[key].columns:
@@ -602,6 +759,18 @@ def _saveLightCurveFromURL(
 
     base._createDir(destDir, silent=silent, verbose=verbose)
 
+    if isinstance(incbad, bool):
+        if incbad:
+            incbad = "yes"
+        else:
+            incbad = "no"
+
+    if isinstance(nosys, bool):
+        if nosys:
+            nosys = "yes"
+        else:
+            nosys = "no"
+
     if not (("URLs" in data) and ("Datasets" in data)):
         raise ValueError("data must contain keys 'URLs' and 'Datasets'.")
 
@@ -649,7 +818,7 @@ def _saveLightCurveFromURL(
 
         if verbose:
             print(f"Saving {outPath}")
-        r = requests.get(url, stream=True, allow_redirects=True)
+        r = base._session.get(url, stream=True, allow_redirects=True)
         if r.ok:
             filedata = r.raw.read()
             with open(outPath, "wb") as outfile:
@@ -762,28 +931,76 @@ def _saveDFToDisk(data, fname, cols, header, sep, qdpH, asQDP, clobber=False, si
     if os.path.exists(fname) and not clobber:
         if not silent:
             print(f"Cannot write `{fname}`, already exists and clobber=False.")
-            return False
+        return False
 
     # print("COLUMNS: ",data.columns.tolist())
     # print("LIST: ", cols)
 
+    # Build the whole file in memory so it goes to disk in a single write.
     txtBuffer = io.StringIO()
+    if asQDP and qdpH is not None:
+        txtBuffer.write(f"{qdpH}\n")
+    if header:
+        if asQDP:
+            txtBuffer.write("!")
+        txtBuffer.write(sep.join(cols) + "\n")
     data.to_csv(txtBuffer, index=False, sep=sep, header=False, columns=cols)
-    with open(fname, "w") as outfile:
-        if verbose:
-            print(f"Writing file: `{fname}`")
-        if asQDP and qdpH is not None:
-            outfile.write(f"{qdpH}\n")
-        if header:
-            if asQDP:
-                outfile.write("!")
-            outfile.write(sep.join(cols) + "\n")
 
+    if verbose:
+        print(f"Writing file: `{fname}`")
+    with open(fname, "w") as outfile:
         outfile.write(txtBuffer.getvalue())
 
     return True
 
 
+def _saveDFToParquet(data, fname, cols, clobber=False, silent=False, verbose=True):
+    """Save a DataFrame to disk as a Parquet file.
+
+    This requires the ``pyarrow`` module.
+
+    Parameters
+    ----------
+
+    data : DataFrame
+        The DataFrame to save.
+
+    fname : str
+        The file name.
+
+    cols : list
+        The columns to write.
+
+    clobber : bool, optional
+        Whether to overwrite files if they exist (default: ``False``).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    bool
+        Whether everything worked OK or not.
+
+    """
+    if verbose:
+        silent = False
+
+    if os.path.exists(fname) and not clobber:
+        if not silent:
+            print(f"Cannot write `{fname}`, already exists and clobber=False.")
+        return False
+
+    if verbose:
+        print(f"Writing file: `{fname}`")
+    data[cols].to_parquet(fname, engine="pyarrow", compression="zstd", index=False)
+    return True
+
+
 # --------------------------------------------------------------------
 # Product-related functions, that are shared between modules
 # --------------------------------------------------------------------
@@ -898,7 +1115,7 @@ def _getLightCurve(
     tmp = base.submitAPICall("downloadLightCurve", sendData, verbose=verbose, minKeys=("Datasets",))
     ret = None
 
-    if "NOLC" in tmp:
+    if tmp.status is base.APIStatus.NODATA:
         if returnData:
             ret = tmp
     else:
@@ -950,6 +1167,7 @@ def _saveLightCurveFromDict(
     suff=None,
     timeFormatInFname=False,
     binningInFname=False,
+    format="text",
     skipErrors=False,
     silent=False,
     verbose=False,
@@ -993,7 +1211,8 @@ def _saveLightCurveFromDict(
 
     suff : str, optional
         The file suffix to use. If ``None`` then it will be "qdp" if
-        ``asQDP`` is ``True``, else ".dat" (default: ``None``).
+        ``asQDP`` is ``True``, "parquet" if ``format='parquet'``, else
+        ".dat" (default: ``None``).
 
     timeFormatInFname : bool, optional
         Whether the filename should include the time format of the light
@@ -1003,6 +1222,12 @@ def _saveLightCurveFromDict(
         Whether the filename should include the binning method of the
         light curve (default: ``False``).
 
+    format : str, optional
+        The file format: 'text' or 'parquet'. Parquet files are much
+        faster to read back into pandas, but require the ``pyarrow``
+        module, and cannot be combined with ``asQDP`` (default:
+        'text').
+
     skipErrors : bool, optional
         If an error occurs saving a file, do not raise a RuntimeError
         but simply continue to the next file (default ``False``).
@@ -1026,6 +1251,11 @@ def _saveLightCurveFromDict(
     if "Datasets" not in data:
         raise ValueError("The `data` parameter should be a light curve dict. It isn't.")
 
+    if format not in ("text", "parquet"):
+        raise ValueError(f"`format` must be 'text' or 'parquet', not `{format}`.")
+    if asQDP and format == "parquet":
+        raise ValueError("Cannot save in qdp and parquet format at the same time.")
+
     theseCurves = []
     if (whichDatasets is None) or (whichDatasets == "all"):
         theseCurves = data["Datasets"]
@@ -1043,6 +1273,8 @@ def _saveLightCurveFromDict(
     if suff is None:
         if asQDP:
             suff = "qdp"
+        elif format == "parquet":
+            suff = "parquet"
         else:
             suff = "dat"
 
@@ -1059,7 +1291,21 @@ def _saveLightCurveFromDict(
                 print(f"Not saving {prefix}{c} as this curve does not exist.")
             continue
 
+        # An existing file with clobber=False is skipped, not an error, so
+        # that saves can be re-run; and it is skipped before any work is
+        # done formatting the data.
+        if (not clobber) and os.path.exists(fname):
+            if not silent:
+                print(f"`{fname}` exists and clobber=False, SKIPPING")
+            continue
+
         cols = data[c].columns.tolist()
+        if format == "parquet":
+            ok = _saveDFToParquet(data[c], fname, cols, clobber=clobber, silent=silent, verbose=verbose)
+            if not (ok or skipErrors):
+                raise RuntimeError(f"Cannot write `{fname}`")
+            continue
+
         qdpheader = None
         if asQDP:
             cols = [x for x in cols if x != "ObsID"]
@@ -1078,7 +1324,7 @@ def _saveLightCurveFromDict(
             verbose=verbose,
         )
         if not (ok or skipErrors):
-            raise RuntimeError("Cannot write `{fname}`")
+            raise RuntimeError(f"Cannot write `{fname}`")
 
 
 # ---------
@@ -1168,8 +1414,7 @@ def _checkRebinStatus(JobID, silent=True, verbose=False):
     if verbose:
         silent = False  # noqa
 
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     sendData = {"JobID": JobID}
 
@@ -1196,8 +1441,7 @@ def _rebinComplete(JobID):
         Whether the job is complete or not.
 
     """
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     tmp = _checkRebinStatus(JobID, silent=True, verbose=False)
 
@@ -1207,6 +1451,81 @@ def _rebinComplete(JobID):
         return False
 
 
+def _waitForJob(checkFunc, JobID, maxWait=3600, initialPoll=1.0, maxPoll=30.0, silent=True, verbose=False):
+    """Wait for a queued job to complete.
+
+    This repeatedly calls ``checkFunc`` until the job is complete, has
+    failed, or ``maxWait`` seconds have passed. The interval between checks starts
+    at ``initialPoll`` seconds and doubles after each check up to
+    ``maxPoll`` seconds, with a random jitter of ±20%, so short jobs are
+    noticed quickly but long jobs do not hammer the server.
+
+    Parameters
+    ----------
+
+    checkFunc : callable
+        The function to check the job status, e.g.
+        ``_checkRebinStatus()``. Must accept ``JobID``, ``silent`` and
+        ``verbose`` arguments and return a ``dict`` with 'statusCode'
+        and 'statusText' keys.
+
+    JobID : int
+        The Job ID.
+
+    maxWait : float, optional
+        The maximum time to wait, in seconds (default: 3600).
+
+    initialPoll : float, optional
+        The interval before the first re-check, in seconds
+        (default: 1).
+
+    maxPoll : float, optional
+        The maximum interval between checks, in seconds (default: 30).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    bool
+        Whether the job completed within ``maxWait``; ``False`` if it
+        failed.
+
+    """
+    if verbose:
+        silent = False
+
+    start = time.monotonic()
+    n = 0
+    while True:
+        tmp = checkFunc(JobID, silent=silent, verbose=verbose)
+        if tmp["statusCode"] == 4:
+            return True
+        # Negative codes mean the job failed or was cancelled, so it will
+        # never complete.
+        if tmp["statusCode"] < 0:
+            if not silent:
+                print(f"Job {JobID} failed with status `{tmp['statusText']}`.")
+            return False
+
+        elapsed = time.monotonic() - start
+        if elapsed >= maxWait:
+            if not silent:
+                print(f"Job {JobID} did not complete within {maxWait} s.")
+            return False
+
+        delay = min(maxPoll, initialPoll * 2**n) * random.uniform(0.8, 1.2)
+        delay = min(delay, maxWait - elapsed)
+        if verbose:
+            print(f"Job {JobID} status is `{tmp['statusText']}`; checking again in {delay:.1f} s.")
+        time.sleep(delay)
+        n += 1
+
+
 def _cancelRebin(JobID, silent=True, verbose=False):
     """Cancels a rebin job.
 
@@ -1232,13 +1551,12 @@ def _cancelRebin(JobID, silent=True, verbose=False):
     if verbose:
         silent = False
 
-    if not isinstance(JobID, int):
-        raise ValueError("JobID must be an int")
+    JobID = base._requireInt("JobID", JobID)
 
     sendData = {"JobID": JobID}
     tmp = base.submitAPICall("cancelRebin", sendData, verbose=verbose, skipErrors=True)
 
-    if "OK" in tmp:
+    if tmp.status is base.APIStatus.OK:
         return True
     else:
         if verbose or not silent:
@@ -1262,6 +1580,7 @@ def _saveSpectrum(
     removeTar=False,
     clobber=False,
     skipErrors=False,
+    maxWorkers=4,
     silent=True,
     verbose=False,
 ):
@@ -1312,6 +1631,9 @@ def _saveSpectrum(
         If an error occurs saving a file, do not raise a RuntimeError
         but simply continue to the next file (default ``False``).
 
+    maxWorkers : int, optional
+        The maximum number of files to download at once (default: 4).
+
     silent : bool, optional
         Whether to suppress all output (default: ``True``).
 
@@ -1337,6 +1659,8 @@ def _saveSpectrum(
 
     base._createDir(destDir, silent=silent, verbose=verbose)
 
+    # Build the list of files to get, then download them in parallel.
+    jobs = []
     for rname in data["rnames"]:
         if (spectra == "all") or (rname in spectra):
             if verbose:
@@ -1348,39 +1672,36 @@ def _saveSpectrum(
 
             # The data file is at the spectrum level so if we wanted it, save it now
             if saveData and ("DataFile" in data[rname]):
-                url = data[rname]["DataFile"]
-                ok = _saveTar(
-                    url,
-                    path,
-                    prefix=prefix,
-                    extract=extract,
-                    removeTar=removeTar,
-                    clobber=clobber,
-                    silent=silent,
-                    verbose=verbose,
-                )
-                if not ok:
-                    if not skipErrors:
-                        raise RuntimeError(f"Cannot save/extract {url} in {path}/")
+                jobs.append((data[rname]["DataFile"], path, True))
 
             if saveImages and ("Modes" in data[rname]):
                 for mode in data[rname]["Modes"]:
                     for model in data[rname][mode]["Models"]:
                         if "Image" in data[rname][mode][model]:
-                            url = data[rname][mode][model]["Image"]
-                            ok = _saveURLToFile(
-                                url,
-                                path,
-                                prefix=prefix,
-                                clobber=clobber,
-                                silent=silent,
-                                verbose=verbose,
-                            )
-                        if not ok:
-                            if skipErrors:
-                                continue
-                            else:
-                                raise RuntimeError(f"Cannot save {url} into {path}/")
+                            jobs.append((data[rname][mode][model]["Image"], path, False))
+
+    def _getOne(job):
+        url, path, isTar = job
+        if isTar:
+            return _saveTar(
+                url,
+                path,
+                prefix=prefix,
+                extract=extract,
+                removeTar=removeTar,
+                clobber=clobber,
+                silent=silent,
+                verbose=verbose,
+            )
+        return _saveURLToFile(url, path, prefix=prefix, clobber=clobber, silent=silent, verbose=verbose)
+
+    results = base._runParallel(_getOne, jobs, maxWorkers=maxWorkers)
+
+    for (url, path, isTar), ok in zip(jobs, results):
+        if not (ok or skipErrors):
+            if isTar:
+                raise RuntimeError(f"Cannot save/extract {url} in {path}/")
+            raise RuntimeError(f"Cannot save {url} into {path}/")
 
 
 def _saveTar(
@@ -1395,6 +1716,11 @@ def _saveTar(
     verbose=False,
     **kwargs,
 ):
+    # If we don't want to keep the tar file, unpack it as it downloads
+    # rather than writing it to disk and reading it back.
+    if extract and removeTar:
+        return _streamTar(url, path, strip=strip, silent=silent, verbose=verbose)
+
     ok = _saveURLToFile(url, path, prefix=prefix, clobber=clobber, silent=silent, verbose=verbose)
     if not ok:
         return False
@@ -1403,10 +1729,11 @@ def _saveTar(
         fname = os.path.basename(url)
         fname = f"{path}/{fname}"
 
-        os.chdir(path)
         if not silent:
             print(f"Extracting `{fname}`")
-        comm = ["tar", "-xzf", fname]
+        # Run tar in the destination rather than chdir-ing there, as
+        # this may be one of several downloads running in parallel.
+        comm = ["tar", "-xzf", os.path.basename(fname)]
         if strip:
             comm.insert(1, "--strip-components=1")
         if verbose:
@@ -1414,7 +1741,7 @@ def _saveTar(
             # pcomm = " ".join(comm)
             # print(f"Calling `{pcomm}`")
 
-        status = subprocess.run(comm, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        status = subprocess.run(comm, cwd=path, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         if status.returncode != 0:
             if verbose:
                 print(f"tar command exited with {status.returncode}")
@@ -1428,3 +1755,89 @@ def _saveTar(
                 print(f"Removing file {fname}")
 
     return True
+
+
+def _streamTar(url, path, strip=False, silent=True, verbose=False):
+    """Download a tar file and extract it on the fly.
+
+    The tar file is never written to disk; its contents are extracted
+    directly from the HTTP response as it arrives.
+
+    Parameters
+    ----------
+
+    url : str
+        The URL of the tar file.
+
+    path : str
+        The directory into which to extract the tar file.
+
+    strip : bool, optional
+        Whether to strip the leading directory from the paths in the
+        tar file, like ``tar --strip-components=1`` (default:
+        ``False``).
+
+    silent : bool, optional
+        Whether to suppress all output (default: ``True``).
+
+    verbose : bool, optional
+        Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+
+    bool
+        Whether everything worked OK or not.
+
+    """
+    if verbose:
+        silent = False
+
+    if not silent:
+        print(f"Downloading and extracting `{url}`")
+
+    r = base._session.get(url, stream=True)
+    try:
+        if not r.ok:
+            if not silent:
+                print(f"Error downloading `{url}`: {r.status_code}")
+            return False
+        r.raw.decode_content = True
+        root = os.path.realpath(path)
+        with tarfile.open(fileobj=r.raw, mode="r|*") as tf:
+            for member in tf:
+                name = member.name
+                if strip:
+                    parts = name.split("/", 1)
+                    if len(parts) < 2 or parts[1] == "":
+                        continue
+                    name = parts[1]
+                # Don't let a member escape the destination directory,
+                # either by its name or by being a link or device.
+                dest = os.path.realpath(os.path.join(root, name))
+                if (
+                    os.path.isabs(name)
+                    or ".." in name.split("/")
+                    or os.path.commonpath([root, dest]) != root
+                    or not (member.isfile() or member.isdir())
+                ):
+                    if not silent:
+                        print(f"Skipping unsafe tar member `{member.name}`")
+                    continue
+                member.name = name
+                if verbose:
+                    print(name)
+                # Python versions with extraction filters also check
+                # the member themselves.
+                if hasattr(tarfile, "data_filter"):
+                    tf.extract(member, path, filter="data")
+                else:
+                    tf.extract(member, path)
+    except (tarfile.TarError, OSError) as e:
+        if not silent:
+            print(f"Error extracting `{url}`: {e}")
+        return False
+    finally:
+        r.close()
+
+    return True
@@ -23,6 +23,23 @@ _apiWarned : bool Whether a warning of an out-of-date module has already
 
 APIURL : str The base URL directory for all API uploads.
 
+_session : requests.Session A session shared by all API calls, so that
+    connections to the server are kept open and reused rather than
+    being set up afresh for every call.
+
+_cacheDir : str The directory in which API responses are cached by
+    _cachedAPICall(). This can be set with the SWIFTTOOLS_CACHE_DIR
+    environment variable.
+
+
+
+Provided classes.
+-----------------
+
+APIStatus - an enumeration of the outcomes of an API call.
+
+APIResult - the ``dict`` of data returned by an API call, with a
+    ``status`` attribute giving the outcome as an APIStatus.
 
 
 Provided functions.
@@ -32,18 +49,35 @@ submitAPICall() - actually submits an API request and checks the result
     is formatted correctly, i.e. the request was succesfully received
     and processed. Raises errors if there are problems.
 
+_cachedAPICall() - a wrapper around submitAPICall() which can store
+    the result on disk and reuse it for identical requests.
+
+_runParallel() - calls a function for each of a list of items, using a
+    pool of threads, and returns the results in order.
+
+_verboseImpliesNotSilent() - a decorator that sets ``silent=False``
+    whenever a function is called with ``verbose=True``.
+
 """
 
 __docformat__ = "restructedtext en"
 
 
+import enum
+import functools
+import hashlib
+import inspect
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import warnings
 import math
 import os
+import time
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from distutils.version import StrictVersion
 from .version import _apiVersion
 
@@ -71,10 +105,59 @@ _apiWarned = False
 
 APIURL = "https://www.swift.ac.uk/API/main.php"
 
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+
+_cacheDir = os.environ.get(
+    "SWIFTTOOLS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "swifttools", "ukssdc")
+)
 
 # _funcList = {"getMetadata": "getMetadata", "queryDB": "queryDB", "listObs"}
 
 
+class APIStatus(enum.Enum):
+    """The outcome of an API call."""
+
+    OK = "OK"
+    ERROR = "ERROR"
+    NOTFOUND = "NOTFOUND"
+    NODATA = "NODATA"
+
+
+# The keys with which the back end flags a call that worked, but found
+# nothing to return.
+_statusKeys = (
+    ("NOTFOUND", APIStatus.NOTFOUND),
+    ("NoSpectrum", APIStatus.NODATA),
+    ("NOLC", APIStatus.NODATA),
+)
+
+
+class APIResult(dict):
+    """The data returned by an API call.
+
+    This is simply a ``dict`` of the data returned by the server, with
+    an extra ``status`` attribute, an ``APIStatus``, so that callers
+    can check the outcome of the call with a single comparison instead
+    of testing for the various keys the back end uses to flag it.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if "ERROR" in self:
+            self.status = APIStatus.ERROR
+            return
+        for key, status in _statusKeys:
+            if key in self:
+                self.status = status
+                return
+        self.status = APIStatus.OK if "OK" in self else APIStatus.ERROR
+
+
 def submitAPICall(func, data, minKeys=None, skipErrors=False, verbose=False):
     """Function to submit an API query and do simple validation.
 
@@ -106,7 +189,7 @@ def submitAPICall(func, data, minKeys=None, skipErrors=False, verbose=False):
 
     Returns
     -------
-        dict
+        APIResult
             The set of returned data.
 
     """
@@ -122,13 +205,13 @@ def submitAPICall(func, data, minKeys=None, skipErrors=False, verbose=False):
         print(f"Uploading data to {APIURL}")
     #        print(data)
 
-    sub = requests.post(APIURL, json=data)
+    sub = _session.post(APIURL, json=data)
     if sub.status_code != 200:
         print("Received HTTP failure from the server.")
         raise RuntimeError(f"An HTTP error occured - HTTP return code {sub.status_code}: {sub.reason}")
 
     # Pull the returned data into JSON.
-    ret = json.loads(sub.text)
+    ret = APIResult(json.loads(sub.text))
 
     # Check if we need to warn about the API
     if "APIVersion" in ret:
@@ -176,6 +259,115 @@ def submitAPICall(func, data, minKeys=None, skipErrors=False, verbose=False):
     return ret
 
 
+def _cachedAPICall(func, data, useCache=False, cacheTTL=None, minKeys=None, skipErrors=False, verbose=False):
+    """Internal function to submit an API query, with an on-disk cache.
+
+    If ``useCache`` is ``True``, the result of a successful call is
+    saved in ``_cacheDir``, keyed on the function and data sent, and a
+    later identical call will read it back from there rather than
+    contacting the server. Otherwise this is just ``submitAPICall()``.
+
+    Only use this for calls which return archival data: the cache
+    cannot know if the data on the server have changed.
+
+    Parameters
+    ----------
+        func : str
+            The function to be carried out.
+
+        data : dict
+            A dictionary of the data to send as JSON with the request.
+
+        useCache : bool, optional
+            Whether to use the cache (default: ``False``).
+
+        cacheTTL : float, optional
+            The maximum age, in seconds, of a cached result that can be
+            used. If ``None``, cached results never expire (default:
+            ``None``).
+
+        minKeys : tuple, optional
+            Passed to ``submitAPICall()``.
+
+        skipErrors : bool, optional
+            Passed to ``submitAPICall()``.
+
+        verbose : bool, optional
+            Whether to write verbose output (default: ``False``).
+
+    Returns
+    -------
+        APIResult
+            The set of returned data.
+
+    """
+    if not useCache:
+        return submitAPICall(func, data, minKeys=minKeys, skipErrors=skipErrors, verbose=verbose)
+
+    keyData = {k: v for k, v in data.items() if k not in ("APIFunc", "APIVersion")}
+    key = json.dumps({"APIFunc": func, "APIVersion": _apiVersion, "data": keyData}, sort_keys=True, default=str)
+    fname = os.path.join(_cacheDir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    try:
+        fresh = (cacheTTL is None) or (time.time() - os.path.getmtime(fname) < cacheTTL)
+        if fresh:
+            with open(fname) as f:
+                ret = APIResult(json.load(f))
+            # Only successful calls are cached, but the "OK" key was
+            # removed by submitAPICall() before the result was saved.
+            ret.status = APIStatus.OK
+            if verbose:
+                print(f"Using cached result from `{fname}`")
+            return ret
+    except (OSError, ValueError):
+        # Not cached, or the cache file is unreadable; get it afresh.
+        pass
+
+    ret = submitAPICall(func, data, minKeys=minKeys, skipErrors=skipErrors, verbose=verbose)
+    if ret.status is APIStatus.OK:
+        try:
+            os.makedirs(_cacheDir, exist_ok=True)
+            tmpName = f"{fname}.{os.getpid()}.tmp"
+            with open(tmpName, "w") as f:
+                json.dump(ret, f)
+            os.replace(tmpName, fname)
+        except OSError as e:
+            if verbose:
+                print(f"Could not write to the cache: {e}")
+
+    return ret
+
+
+def _requireInt(name, value):
+    """Internal function to check that an argument is an integer.
+
+    Numpy integers (e.g. values taken from a pandas DataFrame) are
+    accepted and converted to a plain ``int``, as they cannot be sent
+    to the API as JSON.
+
+    Parameters
+    ----------
+
+    name : str
+        The name of the argument, for the error message.
+
+    value
+        The value to check.
+
+    Returns
+    -------
+
+    int
+        The value, as an int.
+
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, np.integer):
+        return int(value)
+    raise ValueError(f"{name} must be an int")
+
+
 def _createDir(destDir, silent=True, verbose=None):
     """Internal function to make a directory.
 
@@ -195,11 +387,104 @@ def _createDir(destDir, silent=True, verbose=None):
     if not os.path.isdir(destDir):
         if not silent:
             print(f"Making directory {destDir}")
-        os.mkdir(destDir)
+        try:
+            os.mkdir(destDir)
+        except FileExistsError:
+            # Another thread got there first.
+            pass
         if not os.path.isdir(destDir):
             raise RuntimeError(f"Cannot make directory {destDir}")
 
 
+def _verboseImpliesNotSilent(func):
+    """Decorator to make ``verbose=True`` override ``silent``.
+
+    Almost every function in this module has ``silent`` and ``verbose``
+    arguments, and verbose output only makes sense if the function is
+    not silent. This decorator applies that rule before the function is
+    called, so the function itself does not need to.
+
+    Parameters
+    ----------
+
+    func : callable
+        The function to wrap; it must have both ``silent`` and
+        ``verbose`` arguments.
+
+    Returns
+    -------
+
+    callable
+        The wrapped function.
+
+    """
+    params = inspect.signature(func).parameters
+    names = list(params)
+    vIndex = names.index("verbose")
+    sIndex = names.index("silent")
+    vDefault = params["verbose"].default
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if len(args) > vIndex:
+            verbose = args[vIndex]
+        else:
+            verbose = kwargs.get("verbose", vDefault)
+        if verbose:
+            if len(args) > sIndex:
+                args = args[:sIndex] + (False,) + args[sIndex + 1 :]
+            else:
+                kwargs["silent"] = False
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _runParallel(func, items, maxWorkers=8):
+    """Internal function to call a function for several items at once.
+
+    ``func`` is called once per entry in ``items``, using a pool of up
+    to ``maxWorkers`` threads. This is intended for the many places
+    where we make one API call or download per object, where almost all
+    of the time is spent waiting on the network.
+
+    If any call raises an exception, calls which have not yet started
+    are cancelled and the exception is re-raised.
+
+    Parameters
+    ----------
+
+    func : callable
+        The function to call; it receives a single item as its argument.
+
+    items : list or tuple
+        The items to pass to ``func``.
+
+    maxWorkers : int, optional
+        The maximum number of simultaneous calls. If this is 1 or
+        ``None`` the calls are made sequentially (default: 8).
+
+    Returns
+    -------
+
+    list
+        The values returned by ``func``, in the order of ``items``.
+
+    """
+    items = list(items)
+    if (maxWorkers is None) or (maxWorkers <= 1) or (len(items) <= 1):
+        return [func(i) for i in items]
+
+    with ThreadPoolExecutor(max_workers=min(maxWorkers, len(items))) as executor:
+        futures = [executor.submit(func, i) for i in items]
+        try:
+            return [f.result() for f in futures]
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+
 def makeAng(a):
     """Convert an angle into an astropy.coordinates.angle object."""
     if math.isnan(a):
@@ -0,0 +1,57 @@
+"""Shared fixtures for the swifttools tests.
+
+These tests run offline: calls to the UKSSDC API are answered by a
+fake ``submitAPICall()``, set up with the replies each test needs.
+
+"""
+
+import pytest
+
+from swifttools.ukssdc import main as base
+from swifttools.ukssdc.data import GRB
+
+
+class FakeAPI:
+    """Stand-in for ``submitAPICall()``.
+
+    ``replies`` maps the API function name to the reply: a ``dict``, an
+    exception to raise, or a callable which receives the data sent and
+    returns one of those. Every call is recorded in ``calls`` as a
+    ``(func, data)`` tuple.
+
+    """
+
+    def __init__(self):
+        self.replies = {}
+        self.calls = []
+
+    def __call__(self, func, data, minKeys=None, skipErrors=False, verbose=False):
+        self.calls.append((func, dict(data)))
+        reply = self.replies[func]
+        if callable(reply):
+            reply = reply(data)
+        if isinstance(reply, Exception):
+            raise reply
+        return base.APIResult(reply)
+
+    def count(self, func):
+        """Return how many times ``func`` was called."""
+        return sum(1 for f, _ in self.calls if f == func)
+
+
+@pytest.fixture
+def fakeAPI(monkeypatch):
+    """Replace ``submitAPICall()`` with a ``FakeAPI``."""
+    api = FakeAPI()
+    monkeypatch.setattr(base, "submitAPICall", api)
+    return api
+
+
+@pytest.fixture(autouse=True)
+def resetModuleState(monkeypatch):
+    """Give each test fresh batch flags and an empty name cache."""
+    monkeypatch.setattr(GRB, "_batchNamesSupported", True)
+    monkeypatch.setattr(GRB, "_batchSpectraSupported", True)
+    GRB.GRBNameToTargetID.cache_clear()
+    yield
+    GRB.GRBNameToTargetID.cache_clear()
@@ -0,0 +1,85 @@
+"""Tests for the on-disk cache of API results."""
+
+import os
+import time
+
+import pytest
+
+from swifttools.ukssdc import main as base
+
+
+@pytest.fixture
+def cacheDir(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "_cacheDir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def positions(fakeAPI):
+    fakeAPI.replies["getGRBPositions"] = lambda data: {"OK": 1, "targetID": data["targetID"]}
+    return fakeAPI
+
+
+def _call(targetID, **kwargs):
+    return base._cachedAPICall("getGRBPositions", {"targetID": targetID}, **kwargs)
+
+
+def test_cache_hit_skips_the_server(cacheDir, positions):
+    first = _call(1, useCache=True)
+    second = _call(1, useCache=True)
+
+    assert positions.count("getGRBPositions") == 1
+    assert dict(second) == dict(first)
+    assert second.status is base.APIStatus.OK
+    assert len(os.listdir(cacheDir)) == 1
+
+
+def test_cache_is_keyed_on_function_and_data(cacheDir, positions):
+    positions.replies["getGRBTargetList"] = {"OK": 1, "targetList": [1]}
+
+    _call(1, useCache=True)
+    _call(2, useCache=True)
+    base._cachedAPICall("getGRBTargetList", {"targetID": 1}, useCache=True)
+
+    assert len(positions.calls) == 3
+    assert len(os.listdir(cacheDir)) == 3
+
+
+def test_cache_is_not_used_unless_asked(cacheDir, positions):
+    _call(1, useCache=True)
+    _call(1)
+
+    assert positions.count("getGRBPositions") == 2
+
+
+def test_expired_entries_are_refetched(cacheDir, positions):
+    _call(1, useCache=True)
+    old = time.time() - 100
+    for f in os.listdir(cacheDir):
+        os.utime(os.path.join(cacheDir, f), (old, old))
+
+    _call(1, useCache=True, cacheTTL=1000)
+    assert positions.count("getGRBPositions") == 1
+
+    _call(1, useCache=True, cacheTTL=10)
+    assert positions.count("getGRBPositions") == 2
+
+
+def test_failures_are_not_cached(cacheDir, fakeAPI):
+    fakeAPI.replies["getGRBPositions"] = {"ERROR": "oops"}
+
+    _call(1, useCache=True, skipErrors=True)
+
+    assert os.listdir(cacheDir) == []
+
+
+def test_unreadable_cache_file_is_refetched(cacheDir, positions):
+    _call(1, useCache=True)
+    for f in os.listdir(cacheDir):
+        with open(os.path.join(cacheDir, f), "w") as fh:
+            fh.write("not json")
+
+    ret = _call(1, useCache=True)
+
+    assert positions.count("getGRBPositions") == 2
+    assert ret["targetID"] == 1
@@ -0,0 +1,69 @@
+"""Tests for GRBs requested more than once, e.g. under two names."""
+
+import os
+
+import pytest
+
+from swifttools.ukssdc.data import GRB
+from swifttools.ukssdc.data import download as dl
+
+_NAMES = ["GRB A", "GRB A alias", "GRB B"]
+
+
+@pytest.fixture
+def names(fakeAPI):
+    ids = {"GRB A": 1, "GRB A alias": 1, "GRB B": 2}
+    fakeAPI.replies["GRBNamesToTargetIDs"] = lambda data: {"OK": 1, "targetIDs": {n: ids[n] for n in data["names"]}}
+    return fakeAPI
+
+
+def test_handle_list_argument_deduplicates(names):
+    targetIDs, lookup, single, aliases = GRB._handleGRBListArgument(None, _NAMES)
+
+    assert targetIDs == [1, 2]
+    assert lookup == {1: "GRB A", 2: "GRB B"}
+    assert not single
+    assert aliases == {1: ["GRB A", "GRB A alias"], 2: ["GRB B"]}
+
+
+def test_handle_list_argument_repeated_targetID():
+    targetIDs, lookup, single, aliases = GRB._handleGRBListArgument([5, 5, 6], None)
+
+    assert targetIDs == [5, 6]
+    assert lookup == {5: 5, 6: 6}
+    assert not single
+    assert aliases == {5: [5], 6: [6]}
+
+
+def test_spectra_fetched_once_and_saved_under_each_name(tmp_path, names, monkeypatch):
+    names.replies["downloadSpectra"] = {"OK": 1, "Spectra": {"1": {"rnames": []}, "2": {"rnames": []}}}
+    saved = []
+    monkeypatch.setattr(dl, "_saveSpectrum", lambda data, destDir, prefix, **kw: saved.append((destDir, prefix)))
+
+    ret = GRB.getSpectra(GRBName=_NAMES, returnData=True, saveImages=False, destDir=str(tmp_path))
+
+    assert names.count("downloadSpectra") == 1
+    assert set(ret) == set(_NAMES)
+    assert ret["GRB A"] is ret["GRB A alias"]
+    assert sorted(saved) == sorted((os.path.join(str(tmp_path), n), "") for n in _NAMES)
+    assert all((tmp_path / n).is_dir() for n in _NAMES)
+
+
+def test_light_curves_saved_under_each_name(tmp_path, names, monkeypatch):
+    fetched = []
+    saved = []
+
+    def _getLightCurve(objectID, destDir, prefix, returnData, **kw):
+        fetched.append(objectID)
+        saved.append((destDir, prefix))
+        return {"URLs": {}, "Datasets": []} if returnData else None
+
+    monkeypatch.setattr(dl, "_getLightCurve", _getLightCurve)
+    monkeypatch.setattr(
+        dl, "_saveLightCurveFromURL", lambda data, destDir, prefix, **kw: saved.append((destDir, prefix))
+    )
+
+    GRB.getLightCurves(GRBName=_NAMES, subDirs=False, destDir=str(tmp_path))
+
+    assert sorted(fetched) == [1, 2]
+    assert sorted(saved) == sorted((str(tmp_path), f"{n}_") for n in _NAMES)
@@ -0,0 +1,74 @@
+"""Tests for resolving GRB names to targetIDs."""
+
+from swifttools.ukssdc.data import GRB
+
+_IDS = {"GRB A": 1, "GRB B": 2}
+
+
+def _single(data):
+    if data["name"] in _IDS:
+        return {"OK": 1, "targetID": _IDS[data["name"]]}
+    return {"OK": 1, "NOTFOUND": 1}
+
+
+def _batch(data):
+    return {"OK": 1, "targetIDs": {n: _IDS.get(n) for n in data["names"]}}
+
+
+def test_batch_results_fill_the_name_cache(fakeAPI):
+    fakeAPI.replies["GRBNamesToTargetIDs"] = _batch
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    assert GRB.GRBNamesToTargetIDs(["GRB A", "GRB B", "GRB C"]) == {"GRB A": 1, "GRB B": 2, "GRB C": None}
+    assert GRB.GRBNameToTargetID("GRB A") == 1
+    assert GRB.GRBNamesToTargetIDs(["GRB A", "GRB B"]) == {"GRB A": 1, "GRB B": 2}
+
+    assert fakeAPI.count("GRBNamesToTargetIDs") == 1
+    assert fakeAPI.count("GRBNameToTargetID") == 0
+
+
+def test_batch_only_sends_uncached_names(fakeAPI):
+    fakeAPI.replies["GRBNamesToTargetIDs"] = _batch
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    GRB.GRBNameToTargetID("GRB A")
+    GRB.GRBNamesToTargetIDs(["GRB A", "GRB B", "GRB C"])
+
+    sent = [d["names"] for f, d in fakeAPI.calls if f == "GRBNamesToTargetIDs"]
+    assert sent == [["GRB B", "GRB C"]]
+
+
+def test_names_not_found_are_not_cached(fakeAPI):
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    assert GRB.GRBNameToTargetID("GRB C") is None
+    assert GRB.GRBNameToTargetID("GRB C") is None
+    assert fakeAPI.count("GRBNameToTargetID") == 2
+
+
+def test_http_failure_disables_batching(fakeAPI):
+    fakeAPI.replies["GRBNamesToTargetIDs"] = RuntimeError("An HTTP error occured - HTTP return code 500")
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    assert GRB.GRBNamesToTargetIDs(["GRB A", "GRB B"]) == {"GRB A": 1, "GRB B": 2}
+    assert not GRB._batchNamesSupported
+
+    GRB.GRBNameToTargetID.cache_clear()
+    GRB.GRBNamesToTargetIDs(["GRB A", "GRB B"])
+    assert fakeAPI.count("GRBNamesToTargetIDs") == 1
+
+
+def test_transient_error_does_not_disable_batching(fakeAPI):
+    fakeAPI.replies["GRBNamesToTargetIDs"] = {"ERROR": "Database busy"}
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    assert GRB.GRBNamesToTargetIDs(["GRB A", "GRB B"]) == {"GRB A": 1, "GRB B": 2}
+    assert GRB._batchNamesSupported
+
+
+def test_unsupported_function_disables_batching(fakeAPI):
+    fakeAPI.replies["GRBNamesToTargetIDs"] = {"ERROR": "Unknown API function GRBNamesToTargetIDs"}
+    fakeAPI.replies["GRBNameToTargetID"] = _single
+
+    assert GRB.GRBNamesToTargetIDs(["GRB A", "GRB B"]) == {"GRB A": 1, "GRB B": 2}
+    assert not GRB._batchNamesSupported
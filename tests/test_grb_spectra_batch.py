@@ -0,0 +1,73 @@
+"""Tests for getting the spectra of several GRBs in one API call."""
+
+from swifttools.ukssdc import main as base
+from swifttools.ukssdc.data import GRB
+
+
+def _single(data):
+    return {"OK": 1, "rnames": [], "objectID": data["objectID"]}
+
+
+def _getSpectra(targetIDs):
+    return GRB.getSpectra(targetID=targetIDs, returnData=True, saveData=False, saveImages=False)
+
+
+def test_batch_reply_is_used(fakeAPI):
+    fakeAPI.replies["downloadSpectra"] = {"OK": 1, "Spectra": {"1": {"rnames": []}, "2": {"NoSpectrum": 1}}}
+
+    ret = _getSpectra([1, 2])
+
+    assert fakeAPI.count("downloadSpectra") == 1
+    assert fakeAPI.count("downloadSpectrum") == 0
+    assert ret[1].status is base.APIStatus.OK
+    assert ret[2].status is base.APIStatus.NODATA
+
+
+def test_missing_and_failed_entries_are_fetched_singly(fakeAPI):
+    fakeAPI.replies["downloadSpectra"] = {"OK": 1, "Spectra": {"1": {"rnames": []}, "2": {"ERROR": "oops"}}}
+    fakeAPI.replies["downloadSpectrum"] = _single
+
+    ret = _getSpectra([1, 2, 3])
+
+    sent = sorted(d["objectID"] for f, d in fakeAPI.calls if f == "downloadSpectrum")
+    assert sent == [2, 3]
+    assert all(ret[t].status is base.APIStatus.OK for t in (1, 2, 3))
+
+
+def test_http_failure_falls_back_without_disabling(fakeAPI):
+    fakeAPI.replies["downloadSpectra"] = RuntimeError("An HTTP error occured - HTTP return code 500")
+    fakeAPI.replies["downloadSpectrum"] = _single
+
+    ret = _getSpectra([1, 2])
+
+    assert set(ret) == {1, 2}
+    assert fakeAPI.count("downloadSpectrum") == 2
+    assert GRB._batchSpectraSupported
+
+
+def test_transient_error_does_not_disable(fakeAPI):
+    fakeAPI.replies["downloadSpectra"] = {"ERROR": "Database busy"}
+    fakeAPI.replies["downloadSpectrum"] = _single
+
+    _getSpectra([1, 2])
+
+    assert GRB._batchSpectraSupported
+
+
+def test_unsupported_function_disables(fakeAPI):
+    fakeAPI.replies["downloadSpectra"] = {"ERROR": "Unknown API function downloadSpectra"}
+    fakeAPI.replies["downloadSpectrum"] = _single
+
+    _getSpectra([1, 2])
+    assert not GRB._batchSpectraSupported
+
+    _getSpectra([1, 2])
+    assert fakeAPI.count("downloadSpectra") == 1
+
+
+def test_single_target_is_not_batched(fakeAPI):
+    fakeAPI.replies["downloadSpectrum"] = _single
+
+    _getSpectra(1)
+
+    assert fakeAPI.count("downloadSpectra") == 0
@@ -0,0 +1,38 @@
+"""Tests for saving light curves that are already on disk."""
+
+import pandas as pd
+import pytest
+
+from swifttools.ukssdc.data import download as dl
+
+
+@pytest.fixture
+def lcData():
+    df = pd.DataFrame({"Time": [1.0, 2.0], "Rate": [0.5, 0.6]})
+    return {"Datasets": ["PC_incbad"], "Binning": "Counts", "TimeFormat": "MET", "PC_incbad": df}
+
+
+@pytest.mark.parametrize("format", ["text", "parquet"])
+def test_existing_file_is_skipped_without_clobber(tmp_path, lcData, format):
+    suff = "parquet" if format == "parquet" else "dat"
+    fname = tmp_path / f"PC_incbad.{suff}"
+    fname.write_text("old")
+
+    dl._saveLightCurveFromDict(lcData, destDir=str(tmp_path), format=format, clobber=False, silent=True)
+
+    assert fname.read_text() == "old"
+
+
+def test_existing_file_is_overwritten_with_clobber(tmp_path, lcData):
+    fname = tmp_path / "PC_incbad.dat"
+    fname.write_text("old")
+
+    dl._saveLightCurveFromDict(lcData, destDir=str(tmp_path), clobber=True, silent=True)
+
+    assert fname.read_text() == "1.0,0.5\n2.0,0.6\n"
+
+
+def test_new_file_is_written(tmp_path, lcData):
+    dl._saveLightCurveFromDict(lcData, destDir=str(tmp_path), silent=True)
+
+    assert (tmp_path / "PC_incbad.dat").exists()
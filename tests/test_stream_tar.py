@@ -0,0 +1,96 @@
+"""Tests for extracting tar files as they are downloaded."""
+
+import io
+import os
+import tarfile
+
+import pytest
+
+from swifttools.ukssdc import main as base
+from swifttools.ukssdc.data import download as dl
+
+
+class _Response:
+    def __init__(self, content, ok=True):
+        self.raw = io.BytesIO(content)
+        self.ok = ok
+        self.status_code = 200 if ok else 404
+
+    def close(self):
+        pass
+
+
+class _Session:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, stream=False):
+        return self.response
+
+
+def _makeTar(members):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        for name, kind, payload in members:
+            info = tarfile.TarInfo(name)
+            if kind == "file":
+                info.size = len(payload)
+                tf.addfile(info, io.BytesIO(payload))
+            else:
+                info.type = kind
+                info.linkname = payload
+                tf.addfile(info)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def serveTar(monkeypatch):
+    def _serve(members, ok=True):
+        monkeypatch.setattr(base, "_session", _Session(_Response(_makeTar(members), ok=ok)))
+
+    return _serve
+
+
+def _extracted(root):
+    found = []
+    for path, dirs, files in os.walk(root):
+        found.extend(os.path.relpath(os.path.join(path, f), root) for f in files + dirs)
+    return sorted(found)
+
+
+def test_normal_members_are_extracted_and_stripped(tmp_path, serveTar):
+    serveTar([("top/a.txt", "file", b"a"), ("top/sub/b.txt", "file", b"b")])
+
+    assert dl._streamTar("http://x/t.tar.gz", str(tmp_path), strip=True)
+
+    assert _extracted(tmp_path) == ["a.txt", "sub", os.path.join("sub", "b.txt")]
+    assert (tmp_path / "a.txt").read_bytes() == b"a"
+
+
+@pytest.mark.parametrize(
+    "member, strip",
+    [
+        (("top/../../evil.txt", "file", b"x"), True),
+        (("../evil.txt", "file", b"x"), False),
+        (("/tmp/evil.txt", "file", b"x"), False),
+        (("top/link", tarfile.SYMTYPE, "/etc/passwd"), True),
+        (("top/hard", tarfile.LNKTYPE, "top/a.txt"), True),
+    ],
+)
+def test_unsafe_members_are_skipped(tmp_path, serveTar, member, strip):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    serveTar([("top/a.txt", "file", b"a"), member])
+
+    assert dl._streamTar("http://x/t.tar.gz", str(dest), strip=strip)
+
+    expected = ["a.txt"] if strip else ["top", os.path.join("top", "a.txt")]
+    assert _extracted(dest) == expected
+    assert _extracted(tmp_path) == ["dest"] + [os.path.join("dest", e) for e in expected]
+
+
+def test_http_failure_returns_false(tmp_path, serveTar):
+    serveTar([("top/a.txt", "file", b"a")], ok=False)
+
+    assert not dl._streamTar("http://x/t.tar.gz", str(tmp_path))
+    assert _extracted(tmp_path) == []
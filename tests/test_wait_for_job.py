@@ -0,0 +1,64 @@
+"""Tests for waiting for queued jobs to finish."""
+
+import pytest
+
+from swifttools.ukssdc.data import download as dl
+
+
+class _Job:
+    """A job check function which steps through a list of status codes."""
+
+    def __init__(self, codes):
+        self.codes = list(codes)
+        self.checks = 0
+
+    def __call__(self, JobID, silent=True, verbose=False):
+        code = self.codes[min(self.checks, len(self.codes) - 1)]
+        self.checks += 1
+        return {"statusCode": code, "statusText": f"status {code}"}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(dl.time, "sleep", slept.append)
+    return slept
+
+
+def test_returns_true_when_complete(sleeps):
+    job = _Job([1, 2, 4])
+
+    assert dl._waitForJob(job, 1)
+    assert job.checks == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("code", [-1, -2, -3, -4, -10])
+def test_returns_false_at_once_on_failure(sleeps, code):
+    job = _Job([1, code])
+
+    assert not dl._waitForJob(job, 1)
+    assert job.checks == 2
+    assert len(sleeps) == 1
+
+
+def test_poll_interval_grows_to_max(sleeps):
+    job = _Job([1] * 8 + [4])
+
+    assert dl._waitForJob(job, 1, initialPoll=1.0, maxPoll=4.0)
+    assert sleeps[0] <= 1.2
+    assert max(sleeps) <= 4.8
+    assert sleeps[-1] >= 3.2
+
+
+def test_gives_up_after_max_wait(monkeypatch):
+    now = [0.0]
+
+    def _sleep(delay):
+        now[0] += delay
+
+    monkeypatch.setattr(dl.time, "sleep", _sleep)
+    monkeypatch.setattr(dl.time, "monotonic", lambda: now[0])
+
+    assert not dl._waitForJob(_Job([1]), 1, maxWait=60)
+    assert now[0] == pytest.approx(60)